@@ -1,6 +1,8 @@
 import asyncio
-import json
+import orjson
 import importlib
+import itertools
+import threading
 from typing import Any, Dict, List
 import types as python_types
 import uuid
@@ -14,6 +16,8 @@ from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types as genai_types
 
+from .base import is_rate_limit_error
+
 # Assuming get_logger is in agent_eval_framework.utils.logger
 # from ..utils.logger import get_logger
 # Placeholder logger if the above import fails
@@ -21,6 +25,9 @@ import logging
 log = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Serialized once; most error and tool-free outputs share it.
+_EMPTY_TRAJECTORY = orjson.dumps({"tool_calls": []}).decode()
+
 class ADKAgentAdapter:
     def __init__(self, agent_module: str, agent_name: str = "root_agent", app_name: str = "eval_app", user_id: str = "eval_user", **kwargs):
         self.agent_module_str = agent_module
@@ -28,6 +35,14 @@ class ADKAgentAdapter:
         self.agent_config = kwargs
         self.app_name = app_name
         self.user_id = user_id
+        # Session IDs only need to be unique per run: one random prefix per
+        # adapter plus a counter avoids a uuid4 (and urandom read) per prompt.
+        self._session_prefix = uuid.uuid4().hex
+        self._session_counter = itertools.count()
+        # The agent, session service and runner are built on first use and
+        # shared by every prompt; only the per-prompt session is new.
+        self._runner = None
+        self._runner_lock = threading.Lock()
         self._load_agent_class()
         log.info(f"ADKAgentAdapter initialized for agent '{self.agent_name}'")
 
@@ -65,31 +80,50 @@ class ADKAgentAdapter:
                         final_response = part.text.strip()
         return {"response": final_response, "predicted_trajectory": trajectory}
 
+    def _get_runner(self, span) -> Runner:
+        """Returns the shared Runner, building the agent and session service once.
+
+        Args:
+            span: The current span, used to record instantiation errors.
+
+        Returns:
+            The Runner used for every prompt sent through this adapter.
+        """
+        if self._runner is not None:
+            return self._runner
+        with self._runner_lock:
+            if self._runner is None:
+                try:
+                    # Check if the loaded "class" is actually an instance
+                    if not isinstance(self.agent_class, type):
+                        # It's already an instance, just use it
+                        agent = self.agent_class
+                    else:
+                        # It's a class, instantiate it
+                        agent = self.agent_class(**self.agent_config)
+                except Exception as e:
+                    log.error(f"Error instantiating agent {self.agent_name}: {e}", exc_info=True)
+                    span.record_exception(e)
+                    span.set_status(Status(StatusCode.ERROR, f"Agent instantiation failed: {e}"))
+                    raise
+                self._runner = Runner(agent=agent, app_name=self.app_name, session_service=InMemorySessionService())
+        return self._runner
+
     async def _run_agent_async(self, query: str) -> Dict[str, Any]:
         with tracer.start_as_current_span("ADKAgentAdapter._run_agent_async") as span:
             span.set_attribute("agent.name", self.agent_name)
-            session_id = str(uuid.uuid4())
+            session_id = f"{self._session_prefix}-{next(self._session_counter)}"
             span.set_attribute("session.id", session_id)
 
-            try:
-                # Check if the loaded "class" is actually an instance
-                if not isinstance(self.agent_class, type):
-                    # It's already an instance, just use it
-                    agent = self.agent_class
-                else:
-                    # It's a class, instantiate it
-                    agent = self.agent_class(**self.agent_config)
-            except Exception as e:
-                log.error(f"Error instantiating agent {self.agent_name}: {e}", exc_info=True)
-                span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, f"Agent instantiation failed: {e}"))
-                raise
-
-            session_service = InMemorySessionService()
+            runner = self._get_runner(span)
+            session_service = runner.session_service
             await session_service.create_session(app_name=self.app_name, user_id=self.user_id, session_id=session_id)
 
-            runner = Runner(agent=agent, app_name=self.app_name, session_service=session_service)
-            content = genai_types.Content(role="user", parts=[genai_types.Part(text=query)])
+            # The prompt comes from the trusted eval dataset, so skip Pydantic
+            # validation when building the message.
+            content = genai_types.Content.model_construct(
+                role="user", parts=[genai_types.Part.model_construct(text=query)]
+            )
             events = []
 
             with tracer.start_as_current_span("Runner.run_async") as runner_span:
@@ -101,11 +135,40 @@ class ADKAgentAdapter:
                     runner_span.record_exception(e)
                     runner_span.set_status(Status(StatusCode.ERROR, f"runner.run_async failed: {e}"))
                     raise
+                finally:
+                    # Drop the finished session so the shared service does
+                    # not keep every prompt's history for the whole run.
+                    await session_service.delete_session(
+                        app_name=self.app_name, user_id=self.user_id, session_id=session_id
+                    )
 
             parsed_output = self._parse_adk_output_to_dictionary(events)
             span.set_attribute("output.response_length", len(parsed_output.get("response", "")))
             return parsed_output
 
+    def _format_output(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        predicted_trajectory_list = result.get("predicted_trajectory", [])
+        if predicted_trajectory_list:
+            predicted_trajectory = orjson.dumps({"tool_calls": predicted_trajectory_list}, default=str).decode()
+        else:
+            predicted_trajectory = _EMPTY_TRAJECTORY
+
+        # Format for evaluation
+        return {
+            "actual_response": result.get("response"),
+            "predicted_trajectory": predicted_trajectory
+        }
+
+    def _error_output(self, e: Exception, span) -> Dict[str, Any]:
+        log.error(f"Error during ADK agent execution: {e}", exc_info=True)
+        span.record_exception(e)
+        span.set_status(Status(StatusCode.ERROR, f"ADKAgentAdapter.call failed: {e}"))
+        return {
+            "actual_response": "AGENT_EXECUTION_ERROR",
+            "predicted_trajectory": _EMPTY_TRAJECTORY,
+            "error": str(e)
+        }
+
     def __call__(self, prompt: str) -> Dict[str, Any]:
         """
         Makes the adapter instance callable, as expected by EvalTask.evaluate(runnable=...).
@@ -114,26 +177,29 @@ class ADKAgentAdapter:
             span.set_attribute("agent.name", self.agent_name)
             span.set_attribute("input.prompt", prompt)
             try:
-                log.debug(f"ADKAgentAdapter called with prompt: {prompt}")
+                log.debug("ADKAgentAdapter called with prompt: %s", prompt)
                 result = asyncio.run(self._run_agent_async(prompt))
+                return self._format_output(result)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    raise  # Let the runner back off and retry the prompt.
+                return self._error_output(e, span)
 
-                predicted_trajectory_list = result.get("predicted_trajectory", [])
-                wrapped_trajectory = {"tool_calls": predicted_trajectory_list}
-
-                # Format for evaluation
-                return {
-                    "actual_response": result.get("response"),
-                    "predicted_trajectory": json.dumps(wrapped_trajectory)
-                }
+    async def aget_response(self, prompt: str) -> Dict[str, Any]:
+        """
+        Async variant of get_response, letting the runner drive many prompts on one event loop.
+        """
+        with tracer.start_as_current_span("ADKAgentAdapter.aget_response") as span:
+            span.set_attribute("agent.name", self.agent_name)
+            span.set_attribute("input.prompt", prompt)
+            try:
+                log.debug("ADKAgentAdapter awaited with prompt: %s", prompt)
+                result = await self._run_agent_async(prompt)
+                return self._format_output(result)
             except Exception as e:
-                log.error(f"Error during ADK agent execution: {e}", exc_info=True)
-                span.record_exception(e)
-                span.set_status(Status(StatusCode.ERROR, f"ADKAgentAdapter.call failed: {e}"))
-                return {
-                    "actual_response": "AGENT_EXECUTION_ERROR",
-                    "predicted_trajectory": json.dumps({"tool_calls": []}),
-                    "error": str(e)
-                }
+                if is_rate_limit_error(e):
+                    raise  # Let the runner back off and retry the prompt.
+                return self._error_output(e, span)
 
     def get_response(self, prompt: str) -> Dict[str, Any]:
         # Alias for __call__ if needed, or adapt to the evaluator's expected method name
@@ -4,6 +4,15 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
 
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Returns True if `error` is an HTTP 429 (rate limit or quota) error.
+
+    google.api_core errors (`TooManyRequests`, `ResourceExhausted`) and
+    google.genai `APIError`s both carry the HTTP status in `code`. Adapters
+    should re-raise these errors so the runner can retry the prompt.
+    """
+    return getattr(error, "code", None) == 429
+
 class BaseAgentAdapter(ABC):
     """Abstract base class for agent adapters."""
 
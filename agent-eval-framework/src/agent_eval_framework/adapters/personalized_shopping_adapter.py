@@ -3,7 +3,7 @@
 
 import importlib
 from typing import Dict, Any
-from agent_eval_framework.adapters.base import BaseAgentAdapter
+from agent_eval_framework.adapters.base import BaseAgentAdapter, is_rate_limit_error
 from agent_eval_framework.utils.logger import get_logger
 import asyncio
 
@@ -33,6 +33,8 @@ class PersonalizedShoppingAdapter(BaseAgentAdapter):
             # This is a synchronous wrapper for the async ADK agent interaction
             return asyncio.run(self.get_response_async(prompt))
         except Exception as e:
+            if is_rate_limit_error(e):
+                raise  # Let the runner back off and retry the prompt.
             log.error("Error during agent interaction", exc_info=True)
             return {"actual_response": "AGENT_EXECUTION_ERROR"}
 
@@ -40,9 +42,11 @@ class PersonalizedShoppingAdapter(BaseAgentAdapter):
          from google.adk.apps import App
          my_app = App(name="personalized_shopping_app", root_agent=self.agent)
          async with my_app.create_session() as session:
-            response_text = ""
-            async for event in session.send_message(prompt):
-                if event.content and event.content.parts:
-                    response_text += event.content.parts[0].text
+            response_parts = [
+                event.content.parts[0].text
+                async for event in session.send_message(prompt)
+                if event.content and event.content.parts
+            ]
+            response_text = "".join(response_parts)
             log.info("Adapter received async response", extra={"response": response_text})
             return {"actual_response": response_text}
@@ -15,14 +15,100 @@
 """Configures OpenTelemetry for exporting traces to Google Cloud Trace."""
 
 import os
-import sys
+import logging
+import queue
+import threading
 import google.auth
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME
 from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
 
+from .utils.logger import get_logger
+
+log = get_logger(__name__)
+
+class NonBlockingSpanExporter(SpanExporter):
+    """Wraps a span exporter so that export calls return immediately.
+
+    Each batch is queued for a single background daemon thread, which calls
+    the wrapped exporter in submission order. This keeps a slow network
+    export off the caller's thread, so flushing the tracer provider at the
+    end of an evaluation run does not wait on Cloud Trace. `shutdown` waits
+    for all queued batches before shutting the wrapped exporter down.
+
+    A plain daemon thread is used rather than a ThreadPoolExecutor, which
+    refuses new work once interpreter shutdown begins: the tracer provider
+    flushes its last spans from an atexit hook, after that point.
+
+    Attributes:
+        exporter: The wrapped exporter that performs the actual export.
+    """
+    def __init__(self, exporter: SpanExporter):
+        """Initializes the NonBlockingSpanExporter and starts its worker thread.
+
+        Args:
+            exporter: The span exporter to run in the background.
+        """
+        self.exporter = exporter
+        self._queue = queue.SimpleQueue()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="otel-export", daemon=True)
+        self._worker.start()
+
+    def _export(self, spans) -> SpanExportResult:
+        try:
+            result = self.exporter.export(spans)
+            if result != SpanExportResult.SUCCESS:
+                log.warning(f"Background span export failed: {result}")
+            return result
+        except Exception as e:
+            log.warning(f"Background span export raised: {e}")
+            return SpanExportResult.FAILURE
+
+    def _run(self) -> None:
+        """Exports queued batches until it gets the None sentinel."""
+        while True:
+            spans = self._queue.get()
+            if spans is None:
+                return
+            try:
+                self._export(spans)
+            finally:
+                with self._idle:
+                    self._pending -= 1
+                    self._idle.notify_all()
+
+    def export(self, spans) -> SpanExportResult:
+        """Queues the batch for background export and reports success.
+
+        After `shutdown`, batches are exported synchronously instead.
+        """
+        with self._idle:
+            if not self._closed:
+                self._pending += 1
+                self._queue.put(spans)
+                return SpanExportResult.SUCCESS
+        return self._export(spans)
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Waits up to `timeout_millis` for queued batches to be exported."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout_millis / 1000)
+
+    def shutdown(self) -> None:
+        """Drains the queued batches, then shuts down the wrapped exporter."""
+        with self._idle:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+        self.exporter.shutdown()
+
 def setup_opentelemetry():
     """Sets up OpenTelemetry for the application to export to Google Cloud Trace.
 
@@ -36,15 +122,14 @@ def setup_opentelemetry():
         if not project_id: # Sometimes project_id is not in credentials
             project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
     except Exception as e:
-        sys.stdout.write(f"otel_config.py: WARNING: Error getting Google Cloud credentials: {e}\n")
+        log.warning(f"Error getting Google Cloud credentials: {e}")
         project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
 
     if not project_id:
-        sys.stdout.write("otel_config.py: CRITICAL: GOOGLE_CLOUD_PROJECT not set. Tracing to GCP will be disabled.\n")
-        sys.stdout.flush()
+        log.critical("GOOGLE_CLOUD_PROJECT not set. Tracing to GCP will be disabled.")
         return
 
-    sys.stdout.write(f"otel_config.py: Setting up OpenTelemetry for project: {project_id}\n")
+    log.debug("Setting up OpenTelemetry for project: %s", project_id)
 
     # Set up resource - identifies the service producing traces
     resource = Resource.create({
@@ -52,8 +137,9 @@ def setup_opentelemetry():
         "gcp.project_id": project_id
     })
 
-    # Set up trace provider
-    provider = TracerProvider(resource=resource)
+    # Set up trace provider. It registers its own atexit shutdown, which
+    # drains any exports still queued when the process exits.
+    provider = TracerProvider(resource=resource, shutdown_on_exit=True)
     trace.set_tracer_provider(provider)
 
     # Configure Cloud Trace Exporter
@@ -61,30 +147,30 @@ def setup_opentelemetry():
         cloud_trace_exporter = CloudTraceSpanExporter(project_id=project_id)
         # Register the exporter with the TraceProvider using a BatchSpanProcessor
         trace.get_tracer_provider().add_span_processor(
-            BatchSpanProcessor(cloud_trace_exporter)
+            BatchSpanProcessor(NonBlockingSpanExporter(cloud_trace_exporter))
         )
-        sys.stdout.write(f"otel_config.py: CloudTraceSpanExporter configured for project {project_id}.\n")
+        log.debug("CloudTraceSpanExporter configured for project %s.", project_id)
     except Exception as e:
-        sys.stdout.write(f"otel_config.py: CRITICAL: Failed to configure CloudTraceSpanExporter: {e}\n")
-
-    sys.stdout.flush()
+        log.critical(f"Failed to configure CloudTraceSpanExporter: {e}")
 
 def log_otel_status(context: str = ""):
     """Logs the current OpenTelemetry status for debugging purposes.
 
-    This function prints the configured Google Cloud project ID, the type of the
-    current tracer provider, and information about any registered span processors.
+    This function logs the configured Google Cloud project ID, the type of the
+    current tracer provider, and information about any registered span
+    processors. It is a no-op unless DEBUG logging is enabled.
 
     Args:
         context: An optional string to identify the context in which the
             status is being logged.
     """
+    if not log.isEnabledFor(logging.DEBUG):
+        return
     project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
     provider = trace.get_tracer_provider()
-    sys.stdout.write(f"otel_config.py: OTEL STATUS [{context}]: GOOGLE_CLOUD_PROJECT={project_id}\n")
-    sys.stdout.write(f"otel_config.py: OTEL STATUS [{context}]: Provider type: {type(provider)}\n")
+    log.debug("OTEL STATUS [%s]: GOOGLE_CLOUD_PROJECT=%s", context, project_id)
+    log.debug("OTEL STATUS [%s]: Provider type: %s", context, type(provider))
     if hasattr(provider, 'span_processors'):
-        sys.stdout.write(f"otel_config.py: OTEL STATUS [{context}]: Span Processors: {provider.span_processors}\n")
+        log.debug("OTEL STATUS [%s]: Span Processors: %s", context, provider.span_processors)
     else:
-        sys.stdout.write(f"otel_config.py: OTEL STATUS [{context}]: Provider has no span_processors attribute.\n")
-    sys.stdout.flush()
+        log.debug("OTEL STATUS [%s]: Provider has no span_processors attribute.", context)
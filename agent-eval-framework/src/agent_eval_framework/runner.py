@@ -16,8 +16,9 @@
 """Core logic for orchestrating and executing agent evaluations."""
 
 import os
-import json
+import copy
 import yaml
+import orjson
 import importlib
 import dotenv
 import tempfile
@@ -25,12 +26,21 @@ import pandas as pd
 import vertexai
 from google.cloud import aiplatform
 from google.cloud import storage
-from typing import List, Dict, Any, Union, Type
+from google.cloud.storage import transfer_manager
+from typing import List, Dict, Any, Set, Tuple, Union, Type
 import pathlib
 import uuid
-from datetime import datetime
+import time
 import traceback # Import traceback
 import math
+import random
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import argparse
+import string
 from opentelemetry import trace
 
 # CORRECTED IMPORTS:
@@ -41,16 +51,57 @@ from vertexai.preview.evaluation import metrics as preview_metrics
 # Keep these for other metric types if needed
 from vertexai.evaluation import CustomMetric, PointwiseMetric, MetricPromptTemplateExamples
 
+from .adapters.base import BaseAgentAdapter, is_rate_limit_error
+from .utils.jsonl import iter_jsonl_directory, read_jsonl_records
 from .utils.logger import get_logger, set_log_context
+from .utils.response_cache import ResponseCache
 from . import otel_config
 from IPython.display import display
 
+# Prefer the libyaml-backed loader; it keeps safe_load semantics.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 log = get_logger(__name__)
 tracer = trace.get_tracer(__name__)
 
+_RUN_NAME_TIME_FORMAT = "%Y%m%d-%H%M%S"
+
+# Relative config and dataset paths resolve against the repository root,
+# i.e. the parent of the agent-eval-framework directory.
+_PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[3]
+_DOTENV_PATH = _PROJECT_ROOT / ".env"
+
+# Set once the .env file has been loaded into the process environment.
+_ENV_LOADED = False
+
+# Lazily created on first GCS download and reused by later runs.
+_STORAGE_CLIENT = None
+# The (project, location, experiment) the Vertex AI SDKs were last initialized with.
+_VERTEX_AI_INIT_KEY = None
+
+# Blobs at least this large are downloaded as concurrent ranged chunks.
+_GCS_CHUNKED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+_GCS_DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+_EMPTY_TRAJECTORY = '{"tool_calls":[]}'
+
+# Rate-limited (HTTP 429) adapter calls are retried this many times, with
+# full-jitter exponential backoff starting at this delay.
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+# Parsed YAML configs keyed by path, stored with the file's mtime at parse time.
+_CONFIG_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+@functools.lru_cache(maxsize=None)
 def load_class(import_str: str) -> type:
     """Dynamically loads a class from a fully qualified string path.
 
+    Results are cached per `import_str`; failed lookups are not cached.
+
     Args:
         import_str: The fully qualified path to the class
             (e.g., "my_module.my_sub_module.MyClass").
@@ -70,6 +121,25 @@ def load_class(import_str: str) -> type:
         log.error(f"Could not load class {import_str}", exc_info=True)
         raise ImportError(f"Could not load class {import_str}: {e}")
 
+def _get_storage_client() -> storage.Client:
+    """Returns the process-wide GCS client, creating it on first use."""
+    global _STORAGE_CLIENT
+    if _STORAGE_CLIENT is None:
+        _STORAGE_CLIENT = storage.Client()
+    return _STORAGE_CLIENT
+
+def _init_vertex_ai(project_id: str, location: str, experiment_name: str) -> None:
+    """Initializes the Vertex AI SDKs, skipping repeat calls with the same settings."""
+    global _VERTEX_AI_INIT_KEY
+    init_key = (project_id, location, experiment_name)
+    if _VERTEX_AI_INIT_KEY == init_key:
+        log.debug("Vertex AI already initialized, skipping init.")
+        return
+    vertexai.init(project=project_id, location=location)
+    aiplatform.init(project=project_id, location=location, experiment=experiment_name)
+    _VERTEX_AI_INIT_KEY = init_key
+    log.info(f"Vertex AI initialized for project: {project_id}, location: {location}, experiment: {experiment_name}")
+
 def _download_gcs_file(gcs_uri: str) -> str:
     """Downloads a file from Google Cloud Storage to a temporary local path.
 
@@ -83,12 +153,24 @@ def _download_gcs_file(gcs_uri: str) -> str:
         RuntimeError: If the file download fails.
     """
     try:
-        client = storage.Client()
+        client = _get_storage_client()
         bucket_name, blob_name = gcs_uri.replace("gs://", "").split("/", 1)
         bucket = client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
+        blob = bucket.get_blob(blob_name)
+        if blob is None:
+            raise FileNotFoundError(f"GCS object not found: {gcs_uri}")
         with tempfile.NamedTemporaryFile(delete=False, suffix=".jsonl") as temp_file:
-            blob.download_to_filename(temp_file.name)
+            if blob.size is not None and blob.size >= _GCS_CHUNKED_DOWNLOAD_THRESHOLD:
+                # Large datasets: fetch byte ranges in parallel.
+                transfer_manager.download_chunks_concurrently(
+                    blob,
+                    temp_file.name,
+                    chunk_size=_GCS_DOWNLOAD_CHUNK_SIZE,
+                    max_workers=8,
+                    worker_type=transfer_manager.THREAD,
+                )
+            else:
+                blob.download_to_filename(temp_file.name)
             log.info(f"Downloaded {gcs_uri} to {temp_file.name}")
             return temp_file.name
     except Exception as e:
@@ -112,6 +194,12 @@ def _build_metrics(metrics_config: List[Union[str, Dict[str, Any]]]) -> List[Any
         ValueError: If the configuration for a metric is invalid or incomplete.
         TypeError: If a metric specification is not a string or dictionary.
     """
+    # Fast path: computation metrics are passed to the SDK by name.
+    if all(isinstance(m, str) or (isinstance(m, dict) and m.get("type") == "computation") for m in metrics_config):
+        metrics = [m if isinstance(m, str) else m["name"] for m in metrics_config]
+        log.info(f"Appended built-in metrics: {metrics}")
+        return metrics
+
     metrics = []
     for metric_spec in metrics_config:
         if isinstance(metric_spec, str):
@@ -135,6 +223,9 @@ def _build_metrics(metrics_config: List[Union[str, Dict[str, Any]]]) -> List[Any
                 except AttributeError:
                      log.error(f"'{metric_name}' class not found in preview_metrics. Check SDK version.")
                      raise
+            elif metric_type == "computation":
+                metrics.append(metric_name)
+                log.info(f"Appended built-in metric: {metric_name}")
             elif metric_type == "pointwise":
                 metric_prompt_template = metric_spec.get("metric_prompt_template")
                 if not metric_prompt_template:
@@ -160,19 +251,549 @@ def _build_metrics(metrics_config: List[Union[str, Dict[str, Any]]]) -> List[Any
             raise TypeError(f"Invalid metric specification type: {type(metric_spec)}")
     return metrics
 
+def _load_env(dotenv_path: pathlib.Path) -> None:
+    """Loads environment variables from `dotenv_path` once per process tree.
+
+    Later calls are no-ops, so repeated runs do not re-parse the `.env`
+    file. The `_AEF_DOTENV_LOADED` environment variable marks the file as
+    applied, so worker processes (see `run_evaluations`) inherit the values
+    instead of parsing it again. Restart the process to pick up edits to it.
+
+    Args:
+        dotenv_path: The path to the `.env` file.
+    """
+    global _ENV_LOADED
+    # _AEF_DOTENV_LOADED is inherited from a parent process (or set by the
+    # test conftest) that already loaded the file into the environment.
+    if _ENV_LOADED or os.environ.get("_AEF_DOTENV_LOADED"):
+        return
+    if dotenv_path.exists():
+        log.debug(f"Loading environment variables from: {dotenv_path}")
+        dotenv.load_dotenv(dotenv_path=dotenv_path, override=True)
+        os.environ["_AEF_DOTENV_LOADED"] = "1"
+    else:
+        log.warning(f".env file not found at {dotenv_path}")
+    _ENV_LOADED = True
+
+def _load_config(config_path: pathlib.Path) -> Dict[str, Any]:
+    """Loads the evaluation's YAML configuration file.
+
+    Parsed configs are cached by path and modification time, so repeated
+    runs against an unchanged file skip the YAML parse. Each call returns
+    its own deep copy of the cached config.
+
+    Args:
+        config_path: The absolute path to the YAML configuration file.
+
+    Returns:
+        A dictionary containing the loaded configuration.
+
+    Raises:
+        FileNotFoundError: If the config file does not exist.
+    """
+    try:
+        mtime = os.path.getmtime(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    cache_key = str(config_path)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        log.debug(f"Using cached configuration for {config_path}")
+        return copy.deepcopy(cached[1])
+
+    with open(config_path, "r") as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+    _CONFIG_CACHE[cache_key] = (mtime, config)
+    log.debug("Configuration loaded", extra={"config": config})
+    return copy.deepcopy(config)
+
+def _load_dataset(dataset_path: str, project_root: pathlib.Path) -> pd.DataFrame:
+    """Loads the golden dataset from a local or GCS JSONL file.
+
+    A local `dataset_path` may also name a directory, in which case every
+    `.jsonl` file in it is loaded and the records are concatenated.
+
+    Args:
+        dataset_path: A "gs://" URI, or a path relative to `project_root`.
+        project_root: The directory that relative dataset paths resolve against.
+
+    Returns:
+        A DataFrame with one row per JSONL record.
+
+    Raises:
+        FileNotFoundError: If a local dataset file cannot be found.
+    """
+    is_gcs = dataset_path.startswith("gs://")
+    if is_gcs:
+        local_dataset_path = pathlib.Path(_download_gcs_file(dataset_path))
+    else:
+        # Construct path relative to the project_root (agent-eval-framework)
+        local_dataset_path = project_root / dataset_path
+
+    # Opening the file doubles as the existence check.
+    try:
+        if not is_gcs and local_dataset_path.is_dir():
+            records = list(iter_jsonl_directory(local_dataset_path))
+        else:
+            records = read_jsonl_records(local_dataset_path)
+        df_dataset = pd.DataFrame(records)
+    except FileNotFoundError:
+        log.error(f"Dataset file not found at: {local_dataset_path}")
+        raise FileNotFoundError(f"Dataset file not found: {local_dataset_path}")
+    finally:
+        if is_gcs:
+            os.remove(local_dataset_path)
+    log.info(f"Loaded dataset with {len(df_dataset)} records from {local_dataset_path}")
+    return df_dataset
+
+def _row_key(row: Dict[str, Any], columns: List[str]) -> bytes:
+    """Builds a hashable key from a dataset row's values for `columns`."""
+    return orjson.dumps(
+        {col: row.get(col) for col in columns},
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+def _cached_metric_function(scores: Dict[bytes, Any], columns: List[str], metric_function: Any, instance: Dict[str, Any]) -> Any:
+    """Returns a precomputed custom metric score, computing it on a cache miss."""
+    score = scores.get(_row_key(instance, columns))
+    if score is None:
+        return metric_function(instance)
+    return score
+
+async def _precompute_custom_metrics(df_dataset: pd.DataFrame, metrics: List[Any], max_concurrency: int) -> List[Any]:
+    """Evaluates custom function metrics for every row concurrently.
+
+    `EvalTask` calls custom metric functions one row at a time. This scores
+    all rows of all custom metrics up front with `asyncio.gather`, running
+    the (synchronous) functions on worker threads under a semaphore, then
+    swaps each `CustomMetric` for one that looks its score up. The
+    `EvalTask` results therefore keep their usual shape. Rows whose score
+    failed to compute fall back to calling the original function.
+
+    Args:
+        df_dataset: The dataset that will be passed to the evaluation.
+        metrics: The metrics built by `_build_metrics`.
+        max_concurrency: The maximum number of metric calls in flight.
+
+    Returns:
+        `metrics`, with each `CustomMetric` replaced by a cache-backed copy.
+    """
+    custom_metrics = [metric for metric in metrics if isinstance(metric, CustomMetric)]
+    if not custom_metrics:
+        return metrics
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    columns = list(df_dataset.columns)
+    rows = df_dataset.to_dict(orient="records")
+
+    async def _score(metric_function: Any, row: Dict[str, Any]) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(metric_function, row)
+
+    results = await asyncio.gather(
+        *(_score(metric.metric_function, row) for metric in custom_metrics for row in rows),
+        return_exceptions=True,
+    )
+
+    cached_metrics = {}
+    for i, metric in enumerate(custom_metrics):
+        metric_results = results[i * len(rows):(i + 1) * len(rows)]
+        scores = {
+            _row_key(row, columns): result
+            for row, result in zip(rows, metric_results)
+            if not isinstance(result, BaseException)
+        }
+        cached_metrics[id(metric)] = CustomMetric(
+            name=metric.name,
+            metric_function=functools.partial(_cached_metric_function, scores, columns, metric.metric_function),
+        )
+        log.info(f"Precomputed CustomMetric: {metric.name} for {len(scores)}/{len(rows)} rows")
+    return [cached_metrics.get(id(metric), metric) for metric in metrics]
+
+def _compose_column_map(column_mapping: Dict[str, str], prompt_col: str, target_col: str) -> Dict[str, str]:
+    """Composes the user's column mapping with the prompt/target renames.
+
+    The result maps raw dataset columns straight to their final names, so the
+    dataset only needs a single `rename` pass. The configured prompt and
+    target columns end up as "prompt" and "reference", the names the
+    evaluation service expects.
+
+    Args:
+        column_mapping: The `column_mapping` section of the config.
+        prompt_col: The configured prompt column, after `column_mapping`.
+        target_col: The configured target column, after `column_mapping`.
+
+    Returns:
+        A dictionary suitable for `DataFrame.rename(columns=...)`.
+    """
+    canonical = {prompt_col: "prompt", target_col: "reference"}
+    full_map = {src: canonical.get(dst, dst) for src, dst in column_mapping.items()}
+    mapped_targets = set(column_mapping.values())
+    for src, dst in canonical.items():
+        if src not in mapped_targets and src not in full_map:
+            full_map[src] = dst
+    return full_map
+
+def _sanitize_trajectory(traj: Any) -> str:
+    """Normalizes a trajectory value to a `{"tool_calls": [...]}` JSON string.
+
+    Args:
+        traj: A JSON string, a dict with a "tool_calls" key, or a list of
+            tool calls. Anything else is treated as an empty trajectory.
+
+    Returns:
+        The trajectory serialized as a JSON string.
+    """
+    if isinstance(traj, str):
+        try:
+            orjson.loads(traj) # Check if valid JSON
+            return traj
+        except orjson.JSONDecodeError:
+            log.warning(f"Invalid JSON in trajectory column, replacing: {traj}")
+            return _EMPTY_TRAJECTORY # Recover from bad string
+    elif isinstance(traj, dict) and "tool_calls" in traj:
+         return orjson.dumps(traj, default=str).decode()
+    elif isinstance(traj, list):
+         return orjson.dumps({"tool_calls": traj}, default=str).decode()
+    return _EMPTY_TRAJECTORY
+
+def _sanitize_trajectory_column(values: List[Any]) -> List[str]:
+    """Normalizes a whole trajectory column with `_sanitize_trajectory`.
+
+    Trajectory columns are usually homogeneous: every row is a `tool_calls`
+    dict (parsed JSONL) or every row is a list (adapter output). Those
+    columns are serialized in one pass with a single type check up front;
+    mixed columns fall back to per-row dispatch.
+
+    Args:
+        values: The column's values, in row order.
+
+    Returns:
+        The trajectories serialized as JSON strings.
+    """
+    value_types = set(map(type, values))
+    if value_types == {list}:
+        return [orjson.dumps({"tool_calls": traj}, default=str).decode() for traj in values]
+    if value_types == {dict} and all("tool_calls" in traj for traj in values):
+        return [orjson.dumps(traj, default=str).decode() for traj in values]
+    return [_sanitize_trajectory(traj) for traj in values]
+
+def _adapter_error_output(prompt: str, error: Exception) -> Dict[str, Any]:
+    """Logs a failed adapter call and returns the placeholder output for it."""
+    log.error(f"Adapter failed for prompt: {prompt}", exc_info=error)
+    return {"actual_response": "AGENT_EXECUTION_ERROR", "error": str(error)}
+
+def _rate_limit_delay(attempt: int) -> float:
+    """Returns the backoff delay before retry number `attempt` (from 0)."""
+    return random.uniform(0, _RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt)
+
+def _get_response_or_error(adapter: Any, prompt: str, retries: int = _RATE_LIMIT_RETRIES) -> Dict[str, Any]:
+    """Calls `adapter.get_response`, converting a failure into an error output.
+
+    Rate-limit (HTTP 429) errors are retried up to `retries` times with
+    backoff; any other error fails the prompt immediately.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return adapter.get_response(prompt)
+        except Exception as e:
+            if attempt == retries or not is_rate_limit_error(e):
+                return _adapter_error_output(prompt, e)
+            delay = _rate_limit_delay(attempt)
+            log.warning(f"Rate limited, retrying in {delay:.2f}s ({attempt + 1}/{retries}): {e}")
+            time.sleep(delay)
+
+def _generate_responses(
+    adapter: Any, prompts: List[str], max_workers: int = 16, retries: int = _RATE_LIMIT_RETRIES
+) -> List[Dict[str, Any]]:
+    """Calls the agent adapter once per prompt and collects its outputs.
+
+    Agent calls are I/O-bound, so they are overlapped on a thread pool. Each
+    call runs in a copy of the caller's context so log context variables
+    (such as `eval_run_id`) carry over to the worker threads. A failing call
+    does not abort the run; its slot is filled with an
+    "AGENT_EXECUTION_ERROR" response so that row scores as a failure.
+
+    Args:
+        adapter: The agent adapter instance, exposing `get_response(prompt)`.
+        prompts: The prompts to send to the agent, in dataset order.
+        max_workers: The maximum number of concurrent adapter calls.
+        retries: How many times to retry a rate-limited call.
+
+    Returns:
+        A list of adapter output dictionaries, aligned with `prompts`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, _get_response_or_error, adapter, prompt, retries)
+            for prompt in prompts
+        ]
+        return [future.result() for future in futures]
+
+async def _generate_responses_async(
+    adapter: Any, prompts: List[str], max_concurrent: int = 100, retries: int = _RATE_LIMIT_RETRIES
+) -> List[Dict[str, Any]]:
+    """Asynchronous counterpart of `_generate_responses`.
+
+    Used when the adapter exposes a coroutine `aget_response(prompt)`, so
+    many agent calls can be in flight on a single event loop. A semaphore
+    bounds the number of concurrent calls. A rate-limited call keeps its
+    slot while it backs off, so throttling slows the whole run down
+    instead of piling up more requests.
+
+    Args:
+        adapter: The agent adapter instance, exposing `aget_response(prompt)`.
+        prompts: The prompts to send to the agent, in dataset order.
+        max_concurrent: The maximum number of in-flight adapter calls.
+        retries: How many times to retry a rate-limited call.
+
+    Returns:
+        A list of adapter output dictionaries, aligned with `prompts`.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _get_response(prompt: str) -> Dict[str, Any]:
+        async with semaphore:
+            for attempt in range(retries + 1):
+                try:
+                    return await adapter.aget_response(prompt)
+                except Exception as e:
+                    if attempt == retries or not is_rate_limit_error(e):
+                        return _adapter_error_output(prompt, e)
+                    delay = _rate_limit_delay(attempt)
+                    log.warning(f"Rate limited, retrying in {delay:.2f}s ({attempt + 1}/{retries}): {e}")
+                    await asyncio.sleep(delay)
+
+    return await asyncio.gather(*(_get_response(prompt) for prompt in prompts))
+
+def _has_batch_api(adapter: Any) -> bool:
+    """Returns whether the adapter overrides `batch_get_response` with a real bulk call."""
+    batch_method = getattr(type(adapter), "batch_get_response", None)
+    return batch_method is not None and batch_method is not BaseAgentAdapter.batch_get_response
+
+def _generate_responses_batched(adapter: Any, prompts: List[str], batch_size: int = 32) -> List[Dict[str, Any]]:
+    """Generates responses through the adapter's bulk `batch_get_response` API.
+
+    Prompts are sent in chunks of `batch_size`, one call per chunk. If a
+    chunk fails, every prompt in it gets an "AGENT_EXECUTION_ERROR" output.
+
+    Args:
+        adapter: The agent adapter instance, exposing `batch_get_response(prompts)`.
+        prompts: The prompts to send to the agent, in dataset order.
+        batch_size: The maximum number of prompts per bulk call.
+
+    Returns:
+        A list of adapter output dictionaries, aligned with `prompts`.
+    """
+    outputs = []
+    for start in range(0, len(prompts), batch_size):
+        batch = prompts[start:start + batch_size]
+        try:
+            batch_outputs = adapter.batch_get_response(batch)
+            if len(batch_outputs) != len(batch):
+                raise ValueError(f"batch_get_response returned {len(batch_outputs)} outputs for {len(batch)} prompts.")
+            outputs.extend(batch_outputs)
+        except Exception as e:
+            outputs.extend(_adapter_error_output(prompt, e) for prompt in batch)
+    return outputs
+
+def _generate_all_responses(adapter: Any, prompts: List[str], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Generates responses with the best strategy the adapter supports.
+
+    Adapters with a bulk `batch_get_response` are called in batches, those
+    with an async `aget_response` on an event loop, and all others on a
+    thread pool. The per-prompt paths retry rate-limited calls
+    `rate_limit_retries` times (default 3).
+
+    Args:
+        adapter: The agent adapter instance.
+        prompts: The prompts to send to the agent, in dataset order.
+        config: The evaluation config, read for the concurrency settings.
+
+    Returns:
+        A list of adapter output dictionaries, aligned with `prompts`.
+    """
+    if not prompts:
+        return []
+    if _has_batch_api(adapter):
+        return _generate_responses_batched(adapter, prompts, batch_size=config.get("batch_size", 32))
+    retries = config.get("rate_limit_retries", _RATE_LIMIT_RETRIES)
+    if hasattr(adapter, "aget_response"):
+        return asyncio.run(_generate_responses_async(
+            adapter, prompts, max_concurrent=config.get("max_concurrent", 100), retries=retries
+        ))
+    return _generate_responses(adapter, prompts, max_workers=config.get("max_workers", 16), retries=retries)
+
+def _generate_responses_cached(
+    adapter: Any,
+    prompts: List[str],
+    config: Dict[str, Any],
+    cache_config: Dict[str, Any],
+    project_root: pathlib.Path,
+) -> List[Dict[str, Any]]:
+    """Generates responses, reusing outputs cached by earlier runs.
+
+    Only prompts without a fresh cache entry reach the agent. Their outputs
+    are then cached, except for failed calls, which are retried next run.
+    Entries are scoped to the adapter class and its `agent_config`.
+
+    Args:
+        adapter: The agent adapter instance.
+        prompts: The prompts to send to the agent, in dataset order.
+        config: The evaluation config.
+        cache_config: The `response_cache` section of the config, with an
+            optional `path` (relative to `project_root`) and `ttl_seconds`.
+        project_root: The directory that a relative cache path resolves against.
+
+    Returns:
+        A list of adapter output dictionaries, aligned with `prompts`.
+    """
+    namespace = orjson.dumps(
+        [config["agent_adapter_class"], config.get("agent_config", {})],
+        default=str,
+        option=orjson.OPT_SORT_KEYS,
+    ).decode()
+    cache = ResponseCache(
+        project_root / cache_config.get("path", ".eval_cache/responses.sqlite"),
+        namespace,
+        ttl_seconds=cache_config.get("ttl_seconds"),
+    )
+    try:
+        cached = cache.get_many(prompts)
+        misses = [prompt for prompt in prompts if prompt not in cached]
+        log.info(f"Response cache: {len(prompts) - len(misses)} hits, {len(misses)} misses")
+        fresh = dict(zip(misses, _generate_all_responses(adapter, misses, config)))
+        cache.put_many({
+            prompt: output
+            for prompt, output in fresh.items()
+            if "error" not in output and output.get("actual_response") != "AGENT_EXECUTION_ERROR"
+        })
+    finally:
+        cache.close()
+    return [cached[prompt] if prompt in cached else fresh[prompt] for prompt in prompts]
+
+def _to_genai_metrics(metrics: List[Any]) -> List[Any]:
+    """Converts metrics built by `_build_metrics` to GenAI Client metric types.
+
+    Built-in metric names become `types.Metric` and pointwise metrics become
+    `types.LLMMetric` with the same prompt template. Custom function and
+    trajectory tool-use metrics have no GenAI Client equivalent.
+
+    Args:
+        metrics: Metrics built by `_build_metrics`.
+
+    Returns:
+        The equivalent GenAI Client metrics, in the same order.
+
+    Raises:
+        ValueError: If a metric cannot be evaluated by the GenAI Client.
+    """
+    from vertexai import types as vertexai_types
+
+    genai_metrics = []
+    for metric in metrics:
+        if isinstance(metric, str):
+            genai_metrics.append(vertexai_types.Metric(name=metric))
+        elif isinstance(metric, PointwiseMetric):
+            genai_metrics.append(vertexai_types.LLMMetric(
+                name=metric.metric_name,
+                prompt_template=str(metric.metric_prompt_template),
+            ))
+        else:
+            metric_name = getattr(metric, "metric_name", type(metric).__name__)
+            raise ValueError(
+                f"Metric '{metric_name}' ({type(metric).__name__}) is not supported by the 'genai_client' backend. "
+                "Use the 'evaltask' backend for custom function and trajectory tool-use metrics."
+            )
+    return genai_metrics
+
+def _evaluate_with_genai_client(df_dataset: pd.DataFrame, metrics: List[Any], project_id: str, location: str) -> Any:
+    """Evaluates pre-generated responses with the GenAI Client evals API.
+
+    Args:
+        df_dataset: The dataset, including "prompt" and "response" columns.
+        metrics: GenAI Client metrics, as returned by `_to_genai_metrics`.
+        project_id: The Google Cloud project ID.
+        location: The Google Cloud location.
+
+    Returns:
+        The `EvaluationResult` returned by `client.evals.evaluate`.
+    """
+    from vertexai import types as vertexai_types
+
+    client = vertexai.Client(project=project_id, location=location)
+    return client.evals.evaluate(
+        dataset=vertexai_types.EvaluationDataset(eval_dataset_df=df_dataset),
+        metrics=metrics,
+    )
+
+def _template_columns(template: str) -> Union[Set[str], None]:
+    """Returns the `{placeholder}` names in a prompt template, or None if it cannot be parsed."""
+    try:
+        return {field for _, field, _, _ in string.Formatter().parse(template) if field}
+    except ValueError:
+        return None
+
+def _metric_referenced_columns(metrics_config: List[Union[str, Dict[str, Any]]]) -> Union[Set[str], None]:
+    """Collects the dataset columns the configured metrics read from.
+
+    Trajectory metrics need both trajectory columns, a pointwise metric needs
+    every `{placeholder}` in its prompt template (inline, or the example
+    template of the same name), and any metric may list extra columns under
+    a `columns` key. A custom function metric without `columns` could read
+    anything, so no projection is safe; the same holds for a pointwise
+    metric whose template cannot be resolved or parsed.
+
+    Args:
+        metrics_config: The `metrics` section of the config.
+
+    Returns:
+        The set of referenced column names, or None if every column must be
+        kept.
+    """
+    columns = set()
+    for metric_spec in metrics_config:
+        if isinstance(metric_spec, str):
+            metric_name = metric_spec
+        else:
+            metric_name = metric_spec.get("name", "")
+            columns.update(metric_spec.get("columns", []))
+            metric_type = metric_spec.get("type")
+            if metric_type == "custom_function" and "columns" not in metric_spec:
+                return None
+            template = metric_spec.get("metric_prompt_template")
+            if template is None and metric_type == "pointwise":
+                try:
+                    template = MetricPromptTemplateExamples.get_prompt_template(metric_name)
+                except ValueError:
+                    return None
+            if template is not None:
+                template_columns = _template_columns(str(template))
+                if template_columns is None:
+                    return None
+                columns.update(template_columns)
+        if metric_name.startswith("trajectory_"):
+            columns.update(("predicted_trajectory", "reference_trajectory"))
+    return columns
+
 def run_evaluation(config_path: str, experiment_run_name: str = None):
     """Runs the full, configuration-driven evaluation pipeline.
 
     This function orchestrates the entire evaluation process:
     1.  Loads environment variables and the specified YAML configuration file.
     2.  Initializes the Vertex AI SDK and a Vertex AI Experiment.
-    3.  Dynamically loads and instantiates the specified agent adapter.
-    4.  Loads the evaluation dataset (from a local or GCS path).
-    5.  Cleans and preprocesses the dataset.
-    6.  Builds the specified evaluation metrics.
-    7.  Creates and runs a Vertex AI `EvalTask`.
-    8.  Prints and logs the results.
-    9.  Shuts down OpenTelemetry to ensure all traces are exported.
+    3.  Builds the specified evaluation metrics for the selected backend.
+    4.  Dynamically loads and instantiates the specified agent adapter.
+    5.  Loads the evaluation dataset (from a local or GCS path).
+    6.  Generates a response for every prompt via the agent adapter.
+    7.  Cleans and preprocesses the dataset.
+    8.  Runs the evaluation with the configured `backend`: a Vertex AI
+        `EvalTask` ("evaltask", the default) or the GenAI Client evals API
+        ("genai_client").
+    9.  Prints and logs the results.
+    10. Flushes OpenTelemetry so buffered spans are handed to the exporter.
 
     Args:
         config_path: The file path to the evaluation's YAML configuration file.
@@ -180,8 +801,9 @@ def run_evaluation(config_path: str, experiment_run_name: str = None):
             If not provided, a name is generated automatically.
 
     Returns:
-        The `EvalResult` object from the completed `EvalTask`, containing
-        detailed metrics and results, or None if an error occurred.
+        The result object from the selected backend (an `EvalResult` for
+        "evaltask"), containing detailed metrics and results, or None if an
+        error occurred.
 
     Raises:
         EnvironmentError: If required environment variables are not set.
@@ -189,135 +811,134 @@ def run_evaluation(config_path: str, experiment_run_name: str = None):
         ValueError: If the configuration is invalid.
         Exception: For any other errors during the evaluation process.
     """
-    print(f"[DEBUG] run_evaluation called with experiment_run_name: {experiment_run_name}")
-    eval_run_id = str(uuid.uuid4())
+    log.debug("run_evaluation called with experiment_run_name: %s", experiment_run_name)
+    eval_run_id = uuid.uuid4().hex
     set_log_context(eval_run_id=eval_run_id, user_id="agent-eval-framework")
     log.info("Starting evaluation run", extra={"config_path": config_path})
 
     eval_result = None  # Initialize eval_result
     try:
-        # Correct project_root to agent-eval-framework directory
-        project_root = pathlib.Path(__file__).resolve().parent.parent.parent.parent
-        dotenv_path = project_root / ".env"
-        if dotenv_path.exists():
-            log.debug(f"Loading environment variables from: {dotenv_path}")
-            dotenv.load_dotenv(dotenv_path=dotenv_path, override=True)
-        else:
-            log.warning(f".env file not found at {dotenv_path}")
+        project_root = _PROJECT_ROOT
+        _load_env(_DOTENV_PATH)
 
         project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
         location = os.getenv("GOOGLE_CLOUD_LOCATION")
         if not project_id or not location or project_id == "your-project-id-here":
             raise EnvironmentError("GOOGLE_CLOUD_PROJECT and GOOGLE_CLOUD_LOCATION must be set. Check .env file or shell environment.")
 
-        config_abs_path = project_root / config_path
-        if not config_abs_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_abs_path}")
+        config = _load_config(project_root / config_path)
 
-        with open(config_abs_path, "r") as f:
-            config = yaml.safe_load(f)
-        log.debug("Configuration loaded", extra={"config": config})
+        backend = config.get("backend", "evaltask")
+        if backend not in ("evaltask", "genai_client"):
+            raise ValueError(f"Unsupported backend: {backend}. Expected 'evaltask' or 'genai_client'.")
 
         # --- Initialize Vertex AI SDK and AI Platform for Experiments ---
         experiment_name = config.get("experiment_name", "default-agent-evals")
-        vertexai.init(project=project_id, location=location)
-        aiplatform.init(project=project_id, location=location, experiment=experiment_name)
-        log.info(f"Vertex AI initialized for project: {project_id}, location: {location}, experiment: {experiment_name}")
+        _init_vertex_ai(project_id, location, experiment_name)
         # --- END NEW ---
 
+        # Build metrics before generating responses, so a config the backend
+        # cannot evaluate fails before any agent calls are made.
+        metrics = _build_metrics(config["metrics"])
+        if backend == "genai_client":
+            metrics = _to_genai_metrics(metrics)
+
         adapter_class = load_class(config["agent_adapter_class"])
         adapter = adapter_class(**config.get("agent_config", {}))
 
-        dataset_path = config["dataset_path"]
-        local_dataset_path = None
-        if dataset_path.startswith("gs://"):
-            local_dataset_path = _download_gcs_file(dataset_path)
-        else:
-            # Construct path relative to the project_root (agent-eval-framework)
-            possible_path = project_root / dataset_path
-            if possible_path.exists():
-                 local_dataset_path = possible_path
-            else:
-                 log.error(f"Dataset file not found at: {possible_path}")
-                 raise FileNotFoundError(f"Dataset file not found: {possible_path}")
-
-        with open(local_dataset_path, "r") as f:
-            golden_dataset = [json.loads(line) for line in f]
-        if str(dataset_path).startswith("gs://") and local_dataset_path:
-             os.remove(local_dataset_path)
-        df_dataset = pd.DataFrame(golden_dataset)
-        log.info(f"Loaded dataset with {len(df_dataset)} records from {local_dataset_path}")
-
-        column_mapping = config.get("column_mapping", {})
-        df_dataset.rename(columns=column_mapping, inplace=True)
+        df_dataset = _load_dataset(config["dataset_path"], project_root)
 
         prompt_col = config.get("prompt_column", "prompt")
         target_col = config.get("target_column", "reference")
+        column_mapping = _compose_column_map(config.get("column_mapping", {}), prompt_col, target_col)
+        df_dataset.rename(columns=column_mapping, inplace=True, errors="ignore")
 
-        if prompt_col not in df_dataset.columns:
+        if "prompt" not in df_dataset.columns:
              raise ValueError(f"'{prompt_col}' column not found in dataset after mapping.")
-        if target_col not in df_dataset.columns:
+        if "reference" not in df_dataset.columns:
              log.warning(f"'{target_col}' column not found in dataset after mapping. Some metrics may not work.")
 
+        # Only upload the columns the metrics read; golden datasets often carry
+        # ids, tags and other metadata the evaluation service does not need.
+        referenced_columns = _metric_referenced_columns(config["metrics"])
+        if referenced_columns is None:
+            has_trajectory_metrics = True
+        else:
+            needed = {"prompt", "response", "reference"} | referenced_columns | set(config.get("keep_columns", []))
+            has_trajectory_metrics = "predicted_trajectory" in needed
+            unneeded = [col for col in df_dataset.columns if col not in needed]
+            if unneeded:
+                df_dataset = df_dataset.drop(columns=unneeded)
+
+        # Rows without a prompt are sent to the agent as an empty string, not NaN.
+        if df_dataset["prompt"].isnull().any():
+            log.warning("NaN values found in column 'prompt', replacing with empty string before generating responses.")
+            df_dataset["prompt"] = df_dataset["prompt"].fillna('')
+
+        log.info(f"Generating responses for {len(df_dataset)} prompts...")
+        prompts = df_dataset["prompt"].tolist()
+        cache_config = config.get("response_cache")
+        if cache_config:
+            outputs = _generate_responses_cached(adapter, prompts, config, cache_config, project_root)
+        else:
+            outputs = _generate_all_responses(adapter, prompts, config)
+        df_dataset["response"] = [output.get("actual_response", "") for output in outputs]
+        if has_trajectory_metrics:
+            df_dataset["predicted_trajectory"] = [
+                output.get("predicted_trajectory", output.get("actual_trajectory")) for output in outputs
+            ]
+
         # Handle NaN values in columns used for metric API calls
         cols_to_clean = ["prompt", "reference", "response", "predicted_trajectory", "reference_trajectory"]
-        for col in cols_to_clean:
+        present_cols = [col for col in cols_to_clean if col in df_dataset.columns]
+        null_counts = df_dataset[present_cols].isnull().any()
+        null_cols = null_counts.index[null_counts].tolist()
+        if null_cols:
+            log.warning(f"NaN values found in columns {null_cols}, replacing with empty string for API compatibility.")
+            df_dataset[null_cols] = df_dataset[null_cols].fillna('')
+
+        # Ensure trajectory columns are JSON strings
+        for col in ("predicted_trajectory", "reference_trajectory"):
             if col in df_dataset.columns:
-                if df_dataset[col].isnull().any():
-                    log.warning(f"NaN values found in column '{col}', replacing with empty string for API compatibility.")
-                    df_dataset[col] = df_dataset[col].fillna('')
-
-                # Ensure trajectory columns are JSON strings
-                if col in ["predicted_trajectory", "reference_trajectory"]:
-                    def sanitize_traj(traj):
-                        if isinstance(traj, str):
-                            try:
-                                json.loads(traj) # Check if valid JSON
-                                return traj
-                            except json.JSONDecodeError:
-                                log.warning(f"Invalid JSON in trajectory column, replacing: {traj}")
-                                return json.dumps({"tool_calls": []}) # Recover from bad string
-                        elif isinstance(traj, dict) and "tool_calls" in traj:
-                             return json.dumps(traj)
-                        elif isinstance(traj, list):
-                             return json.dumps({"tool_calls": traj})
-                        return json.dumps({"tool_calls": []})
-                    df_dataset[col] = df_dataset[col].apply(sanitize_traj)
-
-        metrics = _build_metrics(config["metrics"])
+                df_dataset[col] = _sanitize_trajectory_column(df_dataset[col].tolist())
 
-        if not experiment_run_name:
+        run_name = experiment_run_name or config.get("experiment_run_name")
+        if not run_name:
             run_name_prefix = config.get("run_name_prefix", "eval")
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            run_name = f"{run_name_prefix}-{timestamp}-{unique_id}"
-        else:
-            run_name = experiment_run_name
-
-        # Use the imported EvalTask from vertexai.preview.evaluation
-        eval_task = EvalTask(
-            dataset=df_dataset,
-            metrics=metrics,
-            experiment=experiment_name
-        )
+            run_name = f"{run_name_prefix}-{time.strftime(_RUN_NAME_TIME_FORMAT)}-{uuid.uuid4().hex[:8]}"
 
-        log.info("Running evaluation using vertexai.preview.evaluation.EvalTask...")
-        eval_result = eval_task.evaluate(
-            runnable=adapter,
-            experiment_run_name=run_name
-        )
+        if backend == "genai_client":
+            log.info("Running evaluation using vertexai.Client().evals...")
+            eval_result = _evaluate_with_genai_client(df_dataset, metrics, project_id, location)
+        else:
+            max_metric_concurrency = config.get("max_metric_concurrency")
+            if max_metric_concurrency:
+                metrics = asyncio.run(_precompute_custom_metrics(df_dataset, metrics, max_metric_concurrency))
+
+            # Use the imported EvalTask from vertexai.preview.evaluation
+            eval_task = EvalTask(
+                dataset=df_dataset,
+                metrics=metrics,
+                experiment=experiment_name
+            )
+
+            log.info("Running evaluation using vertexai.preview.evaluation.EvalTask...")
+            eval_result = eval_task.evaluate(experiment_run_name=run_name)
         log.info("Evaluation complete.")
 
         summary_metrics = eval_result.summary_metrics
+        metrics_table = getattr(eval_result, "metrics_table", None)
         log.info(f"Summary Metrics: {summary_metrics}")
 
         print("\n--- Evaluation Results ---")
-        print(f"Vertex AI Experiment: {experiment_name}, Run: {run_name}")
+        if backend == "evaltask":
+            print(f"Vertex AI Experiment: {experiment_name}, Run: {run_name}")
         print("\nSummary Metrics:")
         print(summary_metrics)
 
-        print("\nMetrics Table:")
-        display(eval_result.metrics_table)
+        if metrics_table is not None:
+            print("\nMetrics Table:")
+            display(metrics_table)
 
         try:
             eval_payload = {
@@ -326,26 +947,64 @@ def run_evaluation(config_path: str, experiment_run_name: str = None):
                 "config_path": config_path,
                 "experiment_name": experiment_name,
                 "run_name": run_name,
+                "backend": backend,
                 "summary_metrics": summary_metrics,
-                "metrics_table": eval_result.metrics_table.to_dict(orient='records'),
+                # Serialized straight from the frame's buffers, skipping a dict copy.
+                "metrics_table_json": metrics_table.to_json(orient='records') if metrics_table is not None else None,
                 "dataset_path": config.get("dataset_path"),
             }
-            log.info("Evaluation results payload", extra={"payload": eval_payload})
+            payload_json = orjson.dumps(eval_payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+            log.info("Evaluation results payload", extra={"payload_json": payload_json})
         except Exception as e:
             log.error(f"Error logging eval results: {e}", exc_info=True)
 
     except Exception as e:
         log.error(f"An error occurred during run_evaluation: {e}", exc_info=True)
-        print(f"ERROR: An error occurred during run_evaluation: {e}")
         # Re-raise the exception to potentially fail the pytest test
         raise
     finally:
+        # Flush rather than shut down, so later runs in this process keep
+        # tracing; the provider shuts itself down at interpreter exit.
         tracer_provider = trace.get_tracer_provider()
-        if hasattr(tracer_provider, "shutdown"):
-            log.info("Flushing OpenTelemetry traces before exit...")
-            tracer_provider.shutdown()
+        if hasattr(tracer_provider, "force_flush"):
+            log.info("Flushing OpenTelemetry traces...")
+            tracer_provider.force_flush(timeout_millis=5000)
             log.info("Traces flushed.")
         else:
-            log.warning("No OpenTelemetry TracerProvider with shutdown found.")
+            log.warning("No OpenTelemetry TracerProvider with force_flush found.")
 
     return eval_result
+
+def run_evaluations(config_paths: List[str], max_tasks: int = 5) -> List[Any]:
+    """Runs several evaluation configs in parallel worker processes.
+
+    Each config (e.g. one per model, prompt or temperature variant) is
+    passed to `run_evaluation` in its own process, so SDK initialization and
+    OpenTelemetry state stay isolated per run. Workers are spawned rather
+    than forked to avoid inheriting exporter threads from the parent.
+
+    Args:
+        config_paths: The YAML configuration files to evaluate.
+        max_tasks: The maximum number of evaluations running at once.
+
+    Returns:
+        The result of each `run_evaluation` call, in `config_paths` order.
+    """
+    log.info(f"Running {len(config_paths)} evaluations with up to {max_tasks} in parallel")
+    with ProcessPoolExecutor(max_workers=max_tasks, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(run_evaluation, config_paths))
+
+def main(argv: List[str] = None) -> None:
+    """Command-line entry point: runs one or more evaluation configs."""
+    parser = argparse.ArgumentParser(description="Run configuration-driven agent evaluations.")
+    parser.add_argument("config_paths", nargs="+", help="Evaluation YAML config files.")
+    parser.add_argument("--max-tasks", type=int, default=5, help="Maximum number of evaluations to run in parallel.")
+    args = parser.parse_args(argv)
+
+    if len(args.config_paths) == 1:
+        run_evaluation(args.config_paths[0])
+    else:
+        run_evaluations(args.config_paths, max_tasks=args.max_tasks)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""JSONL dataset readers, depending only on orjson and the standard library."""
+
+import os
+import pathlib
+from typing import Any, Dict, Iterator, List, Union
+
+import orjson
+
+
+def iter_jsonl_records(path: Union[str, pathlib.Path]) -> Iterator[Dict[str, Any]]:
+    """Yields the records of a JSONL file, skipping blank lines.
+
+    Lines are parsed with orjson straight from the binary file; values are
+    kept as-is, with no date inference.
+
+    Args:
+        path: The path to the JSONL file.
+
+    Yields:
+        The parsed records, in file order.
+
+    Raises:
+        ValueError: If a line is not valid JSON.
+    """
+    loads = orjson.loads
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.isspace():
+                continue
+            try:
+                yield loads(line)
+            except orjson.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of {path}: {e}") from e
+
+
+def read_jsonl_records(path: Union[str, pathlib.Path]) -> List[Dict[str, Any]]:
+    """Parses a JSONL file into a list of records.
+
+    Args:
+        path: The path to the JSONL file.
+
+    Returns:
+        The parsed records, in file order.
+    """
+    return list(iter_jsonl_records(path))
+
+
+def iter_jsonl_directory(directory: Union[str, pathlib.Path]) -> Iterator[Dict[str, Any]]:
+    """Yields the records of every `.jsonl` file in a directory, in file-name order.
+
+    Files are parsed in this process, one after another. Handing files to
+    worker processes does not pay off: the parsed records have to be
+    pickled back, and unpickling them in this process alone costs more
+    than parsing the JSON with orjson.
+
+    Args:
+        directory: The directory holding the JSONL shards.
+
+    Yields:
+        The records of all files, in order.
+    """
+    with os.scandir(directory) as entries:
+        paths = sorted(entry.path for entry in entries if entry.name.endswith(".jsonl") and entry.is_file())
+    for path in paths:
+        yield from iter_jsonl_records(path)
@@ -20,78 +20,307 @@ identifiers like session ID, user ID, and evaluation run ID. It also supports
 forwarding logs to an OpenObserve endpoint if configured via environment variables.
 """
 
+import atexit
+import base64
 import logging
-import json
+import logging.handlers
 import contextvars
-from datetime import datetime
 import os
 import sys
+import queue
+import random
+import threading
+import time
 import urllib.request
-import urllib.error
+import zlib
+from typing import Callable
 
-# Context variables for tracing information.
-session_id_var = contextvars.ContextVar('session_id', default=None)
-user_id_var = contextvars.ContextVar('user_id', default=None)
-eval_run_id_var = contextvars.ContextVar('eval_run_id', default=None)
+import orjson
+
+try:
+    import urllib3
+except ImportError:  # Fall back to urllib.request, without connection reuse.
+    urllib3 = None
+
+# Process-wide state below is created with globals().setdefault so that
+# re-executing this module (e.g. importlib.reload) keeps the existing
+# context, loggers, listener thread and connection pool instead of
+# starting duplicates.
+
+# Tracing information for the current context, as one
+# (session_id, user_id, eval_run_id) tuple so a record needs a single read.
+log_context_var = globals().setdefault(
+    'log_context_var', contextvars.ContextVar('log_context', default=(None, None, None))
+)
+
+
+_http_pool = globals().setdefault('_http_pool', None)
+_http_pool_lock = globals().setdefault('_http_pool_lock', threading.Lock())
+
+
+def _get_http_pool():
+    """Returns the process-wide urllib3 connection pool, creating it on first use.
+
+    Sharing one pool across all `OpenObserveHandler` instances lets
+    consecutive batches reuse the same keep-alive TLS connection.
+    """
+    global _http_pool
+    with _http_pool_lock:
+        if _http_pool is None:
+            _http_pool = urllib3.PoolManager(
+                num_pools=1,
+                maxsize=4,
+                retries=urllib3.Retry(total=2, backoff_factor=0.1),
+            )
+        return _http_pool
+
+
+# Fill ratio of the OpenObserve queue above which records below WARNING are
+# sampled rather than always queued.
+_SAMPLE_THRESHOLD = 0.8
+# Fill ratio above which records below WARNING are always dropped.
+_LOW_PRIORITY_LIMIT = 0.9
+
+# Batches smaller than this are sent uncompressed; gzip's framing would
+# outweigh the savings.
+_GZIP_MIN_BYTES = 200
+
+
+def _gzip(data: bytes) -> bytes:
+    """Gzip-compresses data at level 1, which suits repetitive JSON logs."""
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
 
 
 class OpenObserveHandler(logging.Handler):
     """A logging handler that sends log records to an OpenObserve API endpoint.
 
     This handler formats log records into JSON and sends them to the specified
-    OpenObserve HTTP endpoint using basic authentication.
+    OpenObserve HTTP endpoint using basic authentication, over a shared
+    keep-alive urllib3 connection pool when urllib3 is installed. Batches of
+    200 bytes or more are gzip-compressed.
+
+    `emit` only queues the formatted record; a background thread collects
+    queued records into batches of up to `batch_size`, waiting at most
+    `flush_interval` seconds after the first one, and POSTs each batch as one
+    JSON array. Up to `max_in_flight` batches are sent concurrently, over
+    separate pooled connections, so throughput is not capped at one batch
+    per round trip; batches may therefore arrive out of order. Once the queue is more than 80% full, records below WARNING
+    are sampled: each is dropped with a probability equal to the queue's fill
+    ratio. Above 90% they are always dropped, so the rest of the queue is
+    kept for warnings and errors. When the queue is full, every new record
+    is dropped. Dropped records are counted in `dropped`,
+    and the sender reports new drops to OpenObserve in a WARNING entry.
+    Closing the handler (done by `logging.shutdown` at exit) sends whatever
+    is still queued.
 
     Attributes:
         endpoint_url: The URL of the OpenObserve _json endpoint.
         user: The username for basic authentication.
-        password: The password for basic authentication.
-        opener: A urllib.request opener configured with authentication.
+        batch_size: The maximum number of records sent in one request.
+        flush_interval: The maximum time, in seconds, a record waits for
+            its batch to fill before being sent.
+        max_in_flight: The maximum number of batches being sent at once.
+        dropped: The number of records dropped because the queue was full
+            or under sampling.
     """
-    def __init__(self, endpoint_url: str, user: str, password: str):
-        """Initializes the OpenObserveHandler.
+    def __init__(self, endpoint_url: str, user: str, password: str,
+                 batch_size: int = 500, flush_interval: float = 0.5, max_queue_size: int = 10_000,
+                 max_in_flight: int = 4):
+        """Initializes the OpenObserveHandler and starts its sender thread.
 
         Args:
             endpoint_url: The full URL for the OpenObserve _json API.
             user: The username for authentication.
             password: The password for authentication.
+            batch_size: The maximum number of records sent in one request.
+            flush_interval: The maximum time, in seconds, to wait for a
+                batch to fill.
+            max_queue_size: The maximum number of records waiting to be sent.
+            max_in_flight: The maximum number of batches being sent at once.
         """
         super().__init__()
         self.endpoint_url = endpoint_url
         self.user = user
-        self.password = password
-        # For sending credentials
-        password_mgr = urllib.request.HTTPPasswordMgrWithDefaultRealm()
-        password_mgr.add_password(None, self.endpoint_url, self.user, self.password)
-        self.opener = urllib.request.build_opener(urllib.request.HTTPBasicAuthHandler(password_mgr))
+        # Send credentials preemptively rather than waiting for a 401 challenge.
+        credentials = base64.b64encode(f"{user}:{password}".encode("utf-8")).decode("ascii")
+        self._headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "Python-Logging-Handler",
+            "Authorization": f"Basic {credentials}",
+        }
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_in_flight = max_in_flight
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._max_queue_size = max_queue_size
+        self._sample_above = int(max_queue_size * _SAMPLE_THRESHOLD)
+        self._low_priority_limit = int(max_queue_size * _LOW_PRIORITY_LIMIT)
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        # Batches beyond max_in_flight wait in the collector, not in
+        # _batches, so backpressure still reaches the queue.
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._batches = queue.SimpleQueue()
+        # Plain daemon threads rather than a ThreadPoolExecutor: executors
+        # refuse new work once interpreter shutdown starts, which is before
+        # the atexit hook that drains this handler runs.
+        self._senders = [
+            threading.Thread(target=self._send_loop, name=f"openobserve-log-post-{i}", daemon=True)
+            for i in range(max_in_flight)
+        ]
+        for sender in self._senders:
+            sender.start()
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="openobserve-log-sender", daemon=True)
+        self._worker.start()
 
     def emit(self, record: logging.LogRecord):
-        """Formats the record and sends it to OpenObserve.
-
-        The log record is sent as a single-item list in a JSON array, as
-        expected by the OpenObserve _json endpoint.
+        """Formats the record and queues it for the sender thread.
 
         Args:
             record: The log record to be emitted.
         """
+        # Shed low-priority records before spending time formatting them.
+        queued = self._queue.qsize()
+        if queued > self._sample_above and record.levelno < logging.WARNING:
+            if queued >= self._low_priority_limit or random.random() < queued / self._max_queue_size:
+                self.dropped += 1
+                return
+
         try:
-            log_entry_json = self.format(record)  # This will be a JSON string from JsonFormatter
+            log_entry_json = self._encode(record)
+        except Exception:
+            self.handleError(record)
+            return
 
-            # The _json endpoint expects a JSON array of records.
-            payload = f"[{log_entry_json}]".encode('utf-8')
+        try:
+            self._queue.put_nowait(log_entry_json)
+        except queue.Full:
+            self.dropped += 1
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        """Formats a record as UTF-8 JSON with the handler's formatter."""
+        formatter = self.formatter
+        if isinstance(formatter, JsonFormatter):
+            return formatter.format_bytes(record)
+        return self.format(record).encode('utf-8')
+
+    def _dropped_report(self):
+        """Returns a WARNING entry for records dropped since the last report, or None."""
+        dropped = self.dropped
+        newly_dropped = dropped - self._reported_dropped
+        if newly_dropped <= 0:
+            return None
+        self._reported_dropped = dropped
+        record = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0,
+            "OpenObserveHandler dropped %d log records under backpressure (%d in total)",
+            (newly_dropped, dropped), None,
+        )
+        return self._encode(record)
+
+    def _next_batch(self) -> list:
+        """Blocks for the next batch of queued records; empty if none arrived."""
+        try:
+            if self._stop.is_set():
+                item = self._queue.get_nowait()
+            else:
+                item = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return []
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        # None is the wake-up sentinel queued by close().
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                break
+            remaining = deadline - time.monotonic()
+            try:
+                if self._stop.is_set() or remaining <= 0:
+                    item = self._queue.get_nowait()
+                else:
+                    item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """Sends batches until the handler is closed and the queue is drained."""
+        while True:
+            batch = self._next_batch()
+            report = self._dropped_report()
+            if report is not None:
+                batch.append(report)
+            if batch:
+                self._in_flight.acquire()
+                self._batches.put(batch)
+            elif self._stop.is_set():
+                for sender in self._senders:
+                    self._batches.put(None)
+                for sender in self._senders:
+                    sender.join()
+                return
+
+    def _send_loop(self):
+        """Sends queued batches on a sender thread until it gets the None sentinel."""
+        while True:
+            batch = self._batches.get()
+            if batch is None:
+                return
+            try:
+                self._send(batch)
+            finally:
+                self._in_flight.release()
+
+    def _send(self, batch: list):
+        """POSTs a batch of JSON-encoded records to OpenObserve.
 
-            req = urllib.request.Request(
-                self.endpoint_url,
-                data=payload,
-                headers={'Content-Type': 'application/json', "User-Agent": "Python-Logging-Handler"}
-            )
+        Args:
+            batch: The JSON-encoded log records, as bytes.
+        """
+        try:
+            # The _json endpoint expects a JSON array of records.
+            payload = b"[" + b",".join(batch) + b"]"
+            headers = self._headers
+            if len(payload) >= _GZIP_MIN_BYTES:
+                payload = _gzip(payload)
+                headers = self._gzip_headers
+
+            if urllib3 is not None:
+                response = _get_http_pool().request(
+                    "POST", self.endpoint_url, body=payload, headers=headers, timeout=5.0
+                )
+                if response.status >= 300:
+                    print(f"Error sending log to OpenObserve: {response.status} {response.data}", file=sys.stderr)
+                return
 
-            # Use the opener to handle basic authentication
-            with self.opener.open(req, timeout=5) as response:
+            req = urllib.request.Request(self.endpoint_url, data=payload, headers=headers)
+            with urllib.request.urlopen(req, timeout=5) as response:
                 if response.status >= 300:
                     print(f"Error sending log to OpenObserve: {response.status} {response.read()}", file=sys.stderr)
 
         except Exception as e:
-            print(f"Failed to send log to OpenObserve: {e}", file=sys.stderr)
+            print(f"Failed to send {len(batch)} logs to OpenObserve: {e}", file=sys.stderr)
+
+    def close(self):
+        """Stops the sender thread after it has sent all queued records."""
+        self._stop.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass  # The sender is busy draining and will see the stop flag.
+        if self._worker.is_alive() and self._worker is not threading.current_thread():
+            self._worker.join()
+        super().close()
+
+
+def _dumps(obj) -> bytes:
+    """Encodes an object as compact UTF-8 JSON, converting unknown types with `str`."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
 
 
 class JsonFormatter(logging.Formatter):
@@ -101,12 +330,41 @@ class JsonFormatter(logging.Formatter):
     eval_run_id) and any custom data passed in the `extra` dictionary of a
     logging call.
     """
-    RESERVED_ATTRS = (
+    RESERVED_ATTRS = frozenset((
         'args', 'asctime', 'created', 'exc_info', 'exc_text', 'filename',
         'funcName', 'levelname', 'levelno', 'lineno', 'module',
         'msecs', 'message', 'msg', 'name', 'pathname', 'process',
-        'processName', 'relativeCreated', 'stack_info', 'thread', 'threadName'
-    )
+        'processName', 'relativeCreated', 'stack_info', 'taskName', 'thread', 'threadName'
+    ))
+    # Attribute count of a LogRecord with no extras, before a formatter adds
+    # `message` or `_json_bytes`.
+    _BASE_ATTR_COUNT = len(logging.LogRecord('', 0, '', 0, '', (), None).__dict__)
+
+    # (second, "YYYY-MM-DDTHH:MM:SS.") for the most recently formatted second.
+    # Bursts of records share a second, so only the microseconds change.
+    _last_second = (None, "")
+
+    def __init__(self, *args, **kwargs):
+        """Initializes the formatter and its encoding caches."""
+        super().__init__(*args, **kwargs)
+        self._encoded_names = {}
+        self._last_context = (None, b"")
+
+    def _format_timestamp(self, created: float) -> str:
+        """Formats an epoch timestamp as an ISO 8601 UTC string.
+
+        Args:
+            created: Seconds since the epoch, as in `LogRecord.created`.
+
+        Returns:
+            The timestamp as `YYYY-MM-DDTHH:MM:SS.ffffffZ`.
+        """
+        second = int(created)
+        cached_second, prefix = self._last_second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(second))
+            self._last_second = (second, prefix)
+        return "%s%06dZ" % (prefix, int((created - second) * 1_000_000))
 
     def format(self, record: logging.LogRecord) -> str:
         """Converts a log record to a JSON string.
@@ -117,40 +375,235 @@ class JsonFormatter(logging.Formatter):
         Returns:
             A JSON string representing the log record.
         """
-        log_object = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "logger_name": record.name,
-        }
+        return self.format_bytes(record).decode('utf-8')
 
-        # Add context variables for tracing
-        log_object['session_id'] = session_id_var.get()
-        log_object['user_id'] = user_id_var.get()
-        log_object['eval_run_id'] = eval_run_id_var.get()
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Converts a log record to UTF-8 encoded JSON.
 
-        # Add any extra data passed to the logging call
-        extra_data = {}
-        for key, value in record.__dict__.items():
-            if key not in self.RESERVED_ATTRS and not key.startswith('_'):
-                extra_data[key] = value
-        if extra_data:
-            log_object['extra'] = extra_data
+        Handlers that write bytes (`BytesStreamHandler`, `OpenObserveHandler`)
+        use this directly to skip a decode/encode round-trip. The result is
+        cached on the record as `_json_bytes`, so a record passed to several
+        handlers is serialized once. Values that are not natively
+        JSON-serializable are converted with `str`.
 
+        Args:
+            record: The LogRecord instance.
+
+        Returns:
+            The JSON-encoded log record.
+        """
+        cached = record.__dict__.get('_json_bytes')
+        if cached is not None:
+            return cached
+
+        attrs = record.__dict__
+        # Records queued by get_logger's handler carry the caller's context.
+        log_context = attrs.get('_log_context')
+        # Skip getMessage's %-formatting for the common no-args call.
+        message = record.getMessage() if record.args else record.msg
+        if not isinstance(message, str):
+            message = str(message)
+        parts = [
+            b'{"timestamp":"', self._format_timestamp(record.created).encode('ascii'),
+            b'","level":', self._encode_name(record.levelname),
+            b',"message":', _dumps(message),
+            b',"logger_name":', self._encode_name(record.name),
+            # Add context variables for tracing
+            self._encode_context(log_context or log_context_var.get()),
+        ]
+
+        # Most records have no extras, exception or stack: close the envelope.
+        has_extra = len(attrs) - (log_context is not None) > self._BASE_ATTR_COUNT
+        if not (has_extra or record.exc_info or record.stack_info):
+            parts.append(b"}")
+        else:
+            parts.append(self._encode_optional(record, has_extra))
+        data = b"".join(parts)
+        record._json_bytes = data
+        return data
+
+    def _encode_optional(self, record: logging.LogRecord, has_extra: bool) -> bytes:
+        """Encodes the extra, exception and stack_info fields to close the envelope.
+
+        Args:
+            record: The LogRecord instance.
+            has_extra: Whether the record has attributes beyond a plain
+                LogRecord's.
+
+        Returns:
+            The fields as a JSON fragment starting with a comma and ending
+            with the envelope's closing brace.
+        """
+        optional = {}
+        # Add any extra data passed to the logging call
+        if has_extra:
+            attrs = record.__dict__
+            extra_data = {
+                key: attrs[key] for key in attrs.keys() - self.RESERVED_ATTRS if not key.startswith('_')
+            }
+            if extra_data:
+                optional['extra'] = extra_data
         if record.exc_info:
-            log_object['exception'] = self.formatException(record.exc_info)
+            optional['exception'] = self.formatException(record.exc_info)
         if record.stack_info:
-            log_object['stack_info'] = self.formatStack(record.stack_info)
+            optional['stack_info'] = self.formatStack(record.stack_info)
+        if not optional:
+            return b"}"
+        return b"," + _dumps(optional)[1:]
+
+    def _encode_name(self, name: str) -> bytes:
+        """Returns a logger or level name as a JSON string, cached by name."""
+        encoded = self._encoded_names.get(name)
+        if encoded is None:
+            encoded = self._encoded_names[name] = _dumps(name)
+        return encoded
+
+    def _encode_context(self, log_context: tuple) -> bytes:
+        """Returns the tracing fields as a JSON fragment, cached for the last context seen."""
+        cached_context, encoded = self._last_context
+        if log_context is not cached_context:
+            session_id, user_id, eval_run_id = log_context
+            encoded = b"".join((
+                b',"session_id":', _dumps(session_id),
+                b',"user_id":', _dumps(user_id),
+                b',"eval_run_id":', _dumps(eval_run_id),
+            ))
+            self._last_context = (log_context, encoded)
+        return encoded
+
+
+class BytesStreamHandler(logging.StreamHandler):
+    """A StreamHandler that writes `JsonFormatter` output as raw bytes.
+
+    When the stream has a binary `buffer` (as `sys.stdout` does) and the
+    formatter is a `JsonFormatter`, the encoded record is written straight to
+    the buffer instead of going through a str and the stream's text encoder.
+    Anything else falls back to the regular `StreamHandler` behaviour.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        """Writes the JSON-encoded record and a newline to the stream.
+
+        Args:
+            record: The log record to be emitted.
+        """
+        buffer = getattr(self.stream, 'buffer', None)
+        formatter = self.formatter
+        if buffer is None or not isinstance(formatter, JsonFormatter):
+            super().emit(record)
+            return
+        try:
+            data = formatter.format_bytes(record)
+            with self.lock:
+                # Flush pending text writes so output stays in order.
+                self.stream.flush()
+                buffer.write(data + b"\n")
+                buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# Loggers already handled by get_logger, keyed by name. Writes happen under
+# _loggers_lock so concurrent first calls configure a logger only once.
+_loggers = globals().setdefault('_loggers', {})
+_loggers_lock = globals().setdefault('_loggers_lock', threading.Lock())
+_formatter = globals().setdefault('_formatter', JsonFormatter())
+_queue_handler = globals().setdefault('_queue_handler', None)
+_listener = globals().setdefault('_listener', None)
+_oo_handler = globals().setdefault('_oo_handler', None)
+# The OpenObserve settings last tried, so a failing configuration is not retried for every logger.
+_oo_settings = globals().setdefault('_oo_settings', None)
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """A QueueHandler that hands records to the listener without formatting them.
+
+    Formatting happens on the `QueueListener` thread, which cannot see the
+    caller's context variables, so the tracing context is snapshotted onto
+    the record here, on the calling thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Attaches the current tracing context to the record.
+
+        Args:
+            record: The log record to be queued.
+
+        Returns:
+            The same record, with `_log_context` set.
+        """
+        record._log_context = log_context_var.get()
+        return record
+
+
+def _get_queue_handler():
+    """Returns the process-wide queue handler, starting its listener on first use.
+
+    Every logger gets only this handler, so application threads just enqueue
+    records. A single `QueueListener` thread formats them and passes them to
+    the console handler and, once configured, the `OpenObserveHandler`. Must
+    be called with `_loggers_lock` held.
+
+    Returns:
+        The shared queue handler.
+    """
+    global _queue_handler, _listener
+    if _queue_handler is not None:
+        return _queue_handler
+
+    console_handler = BytesStreamHandler(sys.stdout)
+    console_handler.setFormatter(_formatter)
+
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    # Registered after logging's own shutdown hook, so it runs first: queued
+    # records reach the handlers before logging.shutdown closes them.
+    atexit.register(_listener.stop)
+    _queue_handler = _ContextQueueHandler(log_queue)
+    return _queue_handler
+
+
+def _add_openobserve_handler():
+    """Adds an `OpenObserveHandler` to the listener once it is configured.
+
+    The OPENOBSERVE_* variables are read on each call rather than at import,
+    so settings loaded from a .env file after this module is imported still
+    take effect for loggers created afterwards. Must be called with
+    `_loggers_lock` held, after `_get_queue_handler`.
+
+    Returns:
+        A tuple of the endpoint, if the handler was added by this call, and
+        the error raised while creating the handler, if any.
+    """
+    global _oo_handler, _oo_settings
+    if _oo_handler is not None:
+        return None, None
+    settings = (os.getenv("OPENOBSERVE_ENDPOINT"), os.getenv("OPENOBSERVE_USER"), os.getenv("OPENOBSERVE_PASSWORD"))
+    if not all(settings) or settings == _oo_settings:
+        return None, None
+    _oo_settings = settings
+    endpoint, user, password = settings
+    try:
+        oo_handler = OpenObserveHandler(endpoint_url=endpoint, user=user, password=password)
+    except Exception as e:
+        return None, e
+    oo_handler.setFormatter(_formatter)
+    _listener.handlers = _listener.handlers + (oo_handler,)
+    _oo_handler = oo_handler
+    return endpoint, None
 
-        return json.dumps(log_object)
 
 def get_logger(name: str) -> logging.Logger:
     """Gets a logger configured for structured JSON logging.
 
     This function acts as a facade for logger instantiation. It ensures that
-    each logger is a singleton and is configured with a `JsonFormatter`. It
-    also adds a console handler and, if configured via environment variables,
-    an `OpenObserveHandler`.
+    each logger is a singleton and routes its records through a shared queue
+    to a background thread that formats them with a `JsonFormatter`, writes
+    them to the console and, if configured via environment variables, sends
+    them to OpenObserve. `LOG_LEVEL` and the OPENOBSERVE_* variables are read
+    when a logger is first configured, not when this module is imported.
 
     Args:
         name: The name of the logger (typically `__name__`).
@@ -158,33 +611,45 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         A configured Logger instance.
     """
-    logger = logging.getLogger(name)
-    if logger.hasHandlers():
+    logger = _loggers.get(name)
+    if logger is not None:
         return logger
 
-    logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
-    formatter = JsonFormatter()
+    with _loggers_lock:
+        logger = _loggers.get(name)
+        if logger is not None:
+            return logger
+
+        logger = logging.getLogger(name)
+        if logger.hasHandlers():
+            _loggers[name] = logger
+            return logger
+
+        logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+        logger.addHandler(_get_queue_handler())
+        oo_endpoint, oo_error = _add_openobserve_handler()
+        _loggers[name] = logger
+
+    if oo_error is not None:
+        logger.error(f"Failed to initialize OpenObserve handler: {oo_error}", exc_info=oo_error)
+    elif oo_endpoint is not None:
+        logger.info(f"OpenObserve logging enabled to endpoint: {oo_endpoint}")
+    return logger
 
-    # Always add a console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+def debug_lazy(logger: logging.Logger, build_message: Callable[[], str], **kwargs):
+    """Logs a DEBUG message that is only built when DEBUG is enabled.
 
-    # Add OpenObserve handler if endpoint is configured
-    oo_endpoint = os.getenv("OPENOBSERVE_ENDPOINT")
-    oo_user = os.getenv("OPENOBSERVE_USER")
-    oo_password = os.getenv("OPENOBSERVE_PASSWORD")
+    Use this instead of `logger.debug(f"...")` when the message is expensive
+    to build, since an f-string is evaluated even when the record is then
+    discarded.
 
-    if oo_endpoint and oo_user and oo_password:
-        try:
-            oo_handler = OpenObserveHandler(endpoint_url=oo_endpoint, user=oo_user, password=oo_password)
-            oo_handler.setFormatter(formatter)
-            logger.addHandler(oo_handler)
-            logger.info(f"OpenObserve logging enabled to endpoint: {oo_endpoint}")
-        except Exception as e:
-            logger.error(f"Failed to initialize OpenObserve handler: {e}", exc_info=True)
-
-    return logger
+    Args:
+        logger: The logger to log to.
+        build_message: A callable returning the message string.
+        **kwargs: Keyword arguments passed to `logger.debug`, such as `extra`.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(build_message(), **kwargs)
 
 def set_log_context(session_id: str = None, user_id: str = None, eval_run_id: str = None):
     """Sets tracing identifiers for the current asynchronous context.
@@ -197,12 +662,12 @@ def set_log_context(session_id: str = None, user_id: str = None, eval_run_id: st
         user_id: The user identifier.
         eval_run_id: The evaluation run identifier.
     """
-    if session_id:
-        session_id_var.set(session_id)
-    if user_id:
-        user_id_var.set(user_id)
-    if eval_run_id:
-        eval_run_id_var.set(eval_run_id)
+    current_session_id, current_user_id, current_eval_run_id = log_context_var.get()
+    log_context_var.set((
+        session_id or current_session_id,
+        user_id or current_user_id,
+        eval_run_id or current_eval_run_id,
+    ))
 
 def get_log_context() -> dict:
     """Retrieves the current tracing identifiers from the context.
@@ -211,8 +676,9 @@ def get_log_context() -> dict:
         A dictionary containing the current session_id, user_id, and
         eval_run_id.
     """
+    session_id, user_id, eval_run_id = log_context_var.get()
     return {
-        "session_id": session_id_var.get(),
-        "user_id": user_id_var.get(),
-        "eval_run_id": eval_run_id_var.get(),
+        "session_id": session_id,
+        "user_id": user_id,
+        "eval_run_id": eval_run_id,
     }
@@ -0,0 +1,106 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A persistent exact-match cache of agent responses, keyed by prompt."""
+
+import hashlib
+import pathlib
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import orjson
+
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercases a prompt and collapses its runs of whitespace."""
+    return " ".join(prompt.lower().split())
+
+
+class ResponseCache:
+    """Stores adapter outputs in a SQLite file so reruns can skip the agent.
+
+    Entries are keyed on the normalized prompt together with a `namespace`
+    (typically the adapter class and its config), so a change of agent does
+    not return another agent's answers. Only the thread that created the
+    cache may use it.
+
+    Args:
+        path: The SQLite file to use; its parent directory is created.
+        namespace: Identifies the agent the cached outputs came from.
+        ttl_seconds: Entries older than this are treated as misses. None
+            keeps entries forever.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path], namespace: str, ttl_seconds: Optional[float] = None):
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, output BLOB NOT NULL, ts REAL NOT NULL)"
+        )
+
+    def _key(self, prompt: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.namespace.encode())
+        digest.update(b"\0")
+        digest.update(normalize_prompt(prompt).encode())
+        return digest.hexdigest()
+
+    def get_many(self, prompts: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Looks up cached outputs for `prompts`.
+
+        Args:
+            prompts: The prompts to look up.
+
+        Returns:
+            A dictionary from each prompt with a fresh entry to its output.
+        """
+        keys = {self._key(prompt): prompt for prompt in prompts}
+        min_ts = time.time() - self.ttl_seconds if self.ttl_seconds is not None else float("-inf")
+        found = {}
+        key_list = list(keys)
+        # Stay well under SQLite's limit on bound parameters.
+        for start in range(0, len(key_list), 500):
+            chunk = key_list[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT key, output, ts FROM responses WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for key, output, ts in rows:
+                if ts >= min_ts:
+                    found[keys[key]] = orjson.loads(output)
+        return found
+
+    def put_many(self, outputs: Dict[str, Dict[str, Any]]) -> None:
+        """Stores adapter outputs, replacing any existing entries.
+
+        Args:
+            outputs: A dictionary from prompt to the adapter's output for it.
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, output, ts) VALUES (?, ?, ?)",
+                [(self._key(prompt), orjson.dumps(output, default=str), now) for prompt, output in outputs.items()],
+            )
+
+    def close(self) -> None:
+        """Closes the underlying SQLite connection."""
+        self._conn.close()
@@ -1,19 +1,54 @@
 # agent-eval-framework/tests/conftest.py
 import pytest
+import itertools
 import os
 import dotenv
 import pathlib
+import time
+import uuid
+import yaml
+
+try:
+    _SafeLoader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml.
+    _SafeLoader = yaml.SafeLoader
+
+# Run-name suffixes are this session's tag plus a counter: unique across
+# sessions, and in test order within one.
+_SESSION_TAG = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+_run_counter = itertools.count()
+
+ADK_EVAL_CONFIG_PATH = pathlib.Path(__file__).absolute().parent.parent / "config" / "adk_eval_config.yaml"
+
+def pytest_sessionstart(session):
+    """
+    Parses the ADK evaluation config once per pytest invocation and stores it
+    on the config object for the `_cached_eval_config` fixture.
+    """
+    with open(ADK_EVAL_CONFIG_PATH, 'rb') as f:
+        session.config._eval_cfg = yaml.load(f, Loader=_SafeLoader)
+
+@pytest.fixture(scope="session")
+def _cached_eval_config(pytestconfig):
+    """Provides the ADK evaluation configuration parsed at session start.
+
+    Returns:
+        A dictionary with the evaluation configuration.
+    """
+    return pytestconfig._eval_cfg
 
 def pytest_configure(config):
     """
     Loads environment variables from .env file at the project root
     before any tests are run.
     """
-    project_root = pathlib.Path(__file__).resolve().parent.parent.parent
+    project_root = pathlib.Path(__file__).absolute().parent.parent.parent
     dotenv_path = project_root / ".env"
     if dotenv_path.exists():
         print(f"conftest.py: Loading environment variables from: {dotenv_path}")
         dotenv.load_dotenv(dotenv_path=dotenv_path, override=True)
+        # Lets test-module fixtures skip parsing the same file again.
+        os.environ["_AEF_DOTENV_LOADED"] = "1"
         # Optional: Verify they are loaded
         # print(f"[DEBUG] GOOGLE_CLOUD_PROJECT in conftest: {os.getenv('GOOGLE_CLOUD_PROJECT')}")
         # print(f"[DEBUG] GOOGLE_CLOUD_LOCATION in conftest: {os.getenv('GOOGLE_CLOUD_LOCATION')}")
@@ -24,3 +59,15 @@ def pytest_configure(config):
     print("conftest.py: Setting up OpenTelemetry...")
     otel_config.setup_opentelemetry()
     print("conftest.py: OpenTelemetry setup complete.")
+
+@pytest.fixture(scope="function")
+def unique_run_suffix():
+    """Generates a unique suffix for a test run name.
+
+    This ensures that each test execution creates a new, non-conflicting run
+    in Vertex AI Experiments.
+
+    Returns:
+        A unique string combining the session tag and a per-test counter.
+    """
+    return f"{_SESSION_TAG}-{next(_run_counter)}"
@@ -0,0 +1,37 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the JSONL dataset readers."""
+
+import pytest
+
+from agent_eval_framework.utils.jsonl import iter_jsonl_directory, read_jsonl_records
+
+
+def test_directory_records_are_in_file_name_order(tmp_path):
+    """Tests that shards are read in file-name order and other files are skipped."""
+    (tmp_path / "b.jsonl").write_bytes(b'{"id": 2}\n\n{"id": 3}\n')
+    (tmp_path / "a.jsonl").write_bytes(b'{"id": 1}\n')
+    (tmp_path / "notes.txt").write_bytes(b"not a dataset")
+
+    assert [record["id"] for record in iter_jsonl_directory(tmp_path)] == [1, 2, 3]
+
+
+def test_invalid_line_reports_file_and_line(tmp_path):
+    """Tests that a malformed record names its file and line number."""
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(b'{"id": 1}\n{"id": \n')
+
+    with pytest.raises(ValueError, match=r"line 2 of .*data\.jsonl"):
+        read_jsonl_records(path)
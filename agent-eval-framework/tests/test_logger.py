@@ -0,0 +1,241 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the structured JSON logging module."""
+
+import gzip
+import http.server
+import io
+import json
+import logging
+import os
+import pathlib
+import subprocess
+import sys
+import threading
+import uuid
+
+import pytest
+
+from agent_eval_framework.utils.logger import (
+    BytesStreamHandler,
+    JsonFormatter,
+    OpenObserveHandler,
+    _ContextQueueHandler,
+    debug_lazy,
+    log_context_var,
+    set_log_context,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_log_context():
+    """Restores the log context after each test, so IDs set here do not leak."""
+    previous = log_context_var.get()
+    yield
+    log_context_var.set(previous)
+
+
+def _make_record(msg="hello %s", args=("world",), **extra):
+    """Builds a LogRecord the way `Logger.info(..., extra=extra)` would."""
+    logger = logging.getLogger("test_logger")
+    return logger.makeRecord(
+        "test_logger", logging.INFO, __file__, 1, msg, args, None, extra=extra or None
+    )
+
+
+def test_format_emits_envelope_and_context():
+    """Tests that the formatter emits the fixed envelope and context fields."""
+    set_log_context(session_id="s-1", user_id="u-1", eval_run_id="r-1")
+    entry = json.loads(JsonFormatter().format(_make_record()))
+
+    assert entry["level"] == "INFO"
+    assert entry["message"] == "hello world"
+    assert entry["logger_name"] == "test_logger"
+    assert entry["timestamp"].endswith("Z")
+    assert (entry["session_id"], entry["user_id"], entry["eval_run_id"]) == ("s-1", "u-1", "r-1")
+    assert "extra" not in entry
+
+
+def test_format_serializes_extra_with_str_fallback():
+    """Tests that `extra` values that are not JSON-native are stringified."""
+    run_id = uuid.UUID(int=1)
+    entry = json.loads(JsonFormatter().format(_make_record(run=run_id, count=3)))
+
+    assert entry["extra"] == {"run": str(run_id), "count": 3}
+
+
+def test_format_bytes_matches_format():
+    """Tests that the bytes and str encodings of a record agree."""
+    formatter = JsonFormatter()
+    record = _make_record()
+
+    assert formatter.format_bytes(record).decode("utf-8") == formatter.format(record)
+    assert formatter.format_bytes(record) is record._json_bytes
+
+
+def test_bytes_stream_handler_writes_to_buffer():
+    """Tests that records are written to the binary buffer, one per line."""
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    handler = BytesStreamHandler(stream)
+    handler.setFormatter(JsonFormatter())
+
+    stream.write("before\n")
+    handler.emit(_make_record())
+
+    lines = raw.getvalue().splitlines()
+    assert lines[0] == b"before"
+    assert json.loads(lines[1])["message"] == "hello world"
+
+
+def test_openobserve_handler_batches_and_flushes_on_close(monkeypatch):
+    """Tests that queued records are sent in batches and drained on close."""
+    sent = []
+    monkeypatch.setattr(OpenObserveHandler, "_send", lambda self, batch: sent.append(list(batch)))
+    handler = OpenObserveHandler(
+        "http://localhost/_json", "user", "password", batch_size=2, flush_interval=5, max_in_flight=1
+    )
+    handler.setFormatter(JsonFormatter())
+
+    for i in range(5):
+        handler.emit(_make_record("record %d", (i,)))
+    handler.close()
+
+    assert [len(batch) for batch in sent] == [2, 2, 1]
+    assert [json.loads(entry)["message"] for batch in sent for entry in batch] == [f"record {i}" for i in range(5)]
+
+
+def test_timestamp_is_iso_utc_with_microseconds():
+    """Tests the cached timestamp formatting, including a change of second."""
+    formatter = JsonFormatter()
+
+    assert formatter._format_timestamp(1700000000.000123) == "2023-11-14T22:13:20.000123Z"
+    assert formatter._format_timestamp(1700000000.5) == "2023-11-14T22:13:20.500000Z"
+    assert formatter._format_timestamp(1700000001.25) == "2023-11-14T22:13:21.250000Z"
+
+
+def test_queued_record_keeps_callers_context():
+    """Tests that records formatted off-thread use the context they were logged in."""
+    handler = _ContextQueueHandler(None)
+    set_log_context(session_id="caller")
+    record = handler.prepare(_make_record())
+    set_log_context(session_id="other")
+
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["session_id"] == "caller"
+    assert "extra" not in entry
+
+
+def test_debug_lazy_builds_message_only_when_enabled():
+    """Tests that the message callable is skipped for a disabled DEBUG level."""
+    logger = logging.getLogger("test_logger.lazy")
+    calls = []
+    logger.setLevel(logging.INFO)
+    debug_lazy(logger, lambda: calls.append("built") or "message")
+    logger.setLevel(logging.DEBUG)
+    debug_lazy(logger, lambda: calls.append("built") or "message")
+
+    assert calls == ["built"]
+
+
+class _SinkHandler(http.server.BaseHTTPRequestHandler):
+    """Collects the records POSTed to a local OpenObserve stand-in."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        self.server.records.extend(json.loads(body))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _run_with_sink(script, env):
+    """Runs `script` in a child interpreter with a local OpenObserve sink.
+
+    Args:
+        script: The Python source to run; `{endpoint}` is replaced with the
+            sink's URL.
+        env: Extra environment variables; `{endpoint}` is replaced in values.
+
+    Returns:
+        A tuple of the completed process and the records the sink received.
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SinkHandler)
+    server.records = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_port}/api/default/test/_json"
+    src_dir = pathlib.Path(__file__).absolute().parent.parent / "src"
+    child_env = {
+        key: value for key, value in os.environ.items()
+        if not key.startswith("OPENOBSERVE_") and key != "LOG_LEVEL"
+    }
+    child_env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(src_dir), os.environ.get("PYTHONPATH")]))
+    child_env.update({key: value.replace("{endpoint}", endpoint) for key, value in env.items()})
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", script.replace("{endpoint}", endpoint)],
+            env=child_env, capture_output=True, timeout=60,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return result, server.records
+
+
+def test_openobserve_records_are_delivered_at_exit():
+    """Tests that records still queued when the process exits are sent."""
+    script = (
+        "from agent_eval_framework.utils.logger import get_logger\n"
+        "log = get_logger('exit_test')\n"
+        "for i in range(1200):\n"
+        "    log.info(f'record {i}')\n"
+    )
+    result, records = _run_with_sink(script, {
+        "OPENOBSERVE_ENDPOINT": "{endpoint}",
+        "OPENOBSERVE_USER": "user",
+        "OPENOBSERVE_PASSWORD": "password",
+        "LOG_LEVEL": "INFO",
+    })
+
+    assert result.returncode == 0, result.stderr.decode()
+    assert b"Traceback" not in result.stderr, result.stderr.decode()
+    messages = {record["message"] for record in records if record["logger_name"] == "exit_test"}
+    assert messages >= {f"record {i}" for i in range(1200)}
+
+
+def test_settings_set_after_import_apply_to_later_loggers():
+    """Tests that LOG_LEVEL and OPENOBSERVE_* set after import (as by .env) take effect."""
+    script = (
+        "import os\n"
+        "from agent_eval_framework.utils.logger import get_logger\n"
+        "early = get_logger('early')\n"
+        "os.environ.update(OPENOBSERVE_ENDPOINT='{endpoint}', OPENOBSERVE_USER='user',\n"
+        "                  OPENOBSERVE_PASSWORD='password', LOG_LEVEL='DEBUG')\n"
+        "late = get_logger('late')\n"
+        "late.debug('late debug')\n"
+        "early.info('early info')\n"
+        "early.debug('early debug')\n"
+    )
+    result, records = _run_with_sink(script, {})
+
+    assert result.returncode == 0, result.stderr.decode()
+    messages = {(record["logger_name"], record["message"]) for record in records}
+    assert ("late", "late debug") in messages
+    assert ("early", "early info") in messages
+    assert ("early", "early debug") not in messages
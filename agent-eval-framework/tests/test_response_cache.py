@@ -0,0 +1,47 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the persistent agent response cache."""
+
+from agent_eval_framework.utils.response_cache import ResponseCache
+
+
+def test_round_trip_matches_normalized_prompt(tmp_path):
+    """Tests that stored outputs are found again across cache instances."""
+    cache = ResponseCache(tmp_path / "cache" / "responses.sqlite", "agent-a")
+    cache.put_many({"Find red  sneakers": {"actual_response": "ok"}})
+    cache.close()
+
+    cache = ResponseCache(tmp_path / "cache" / "responses.sqlite", "agent-a")
+    assert cache.get_many(["find red sneakers", "other"]) == {"find red sneakers": {"actual_response": "ok"}}
+    cache.close()
+
+
+def test_entries_are_scoped_to_namespace(tmp_path):
+    """Tests that one agent's outputs are not returned for another agent."""
+    ResponseCache(tmp_path / "r.sqlite", "agent-a").put_many({"p": {"actual_response": "a"}})
+
+    assert ResponseCache(tmp_path / "r.sqlite", "agent-b").get_many(["p"]) == {}
+
+
+def test_expired_entries_are_misses(tmp_path, monkeypatch):
+    """Tests that entries older than `ttl_seconds` are ignored."""
+    cache = ResponseCache(tmp_path / "r.sqlite", "agent-a", ttl_seconds=60)
+    monkeypatch.setattr("agent_eval_framework.utils.response_cache.time.time", lambda: 1000.0)
+    cache.put_many({"p": {"actual_response": "a"}})
+
+    monkeypatch.setattr("agent_eval_framework.utils.response_cache.time.time", lambda: 1059.0)
+    assert cache.get_many(["p"]) == {"p": {"actual_response": "a"}}
+    monkeypatch.setattr("agent_eval_framework.utils.response_cache.time.time", lambda: 1061.0)
+    assert cache.get_many(["p"]) == {}
@@ -16,17 +16,11 @@
 
 import pytest
 import os
-import sys
 import pathlib
 from collections import defaultdict
-from dotenv import load_dotenv
-import pandas as pd
 
-# --- Add project root to sys.path ---
-PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-print(f"Adjusted sys.path for test: {sys.path}")
+# The project root is put on sys.path by pytest's `pythonpath` setting.
+PROJECT_ROOT = pathlib.Path(__file__).absolute().parent.parent.parent
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_env():
@@ -34,7 +28,12 @@ def setup_env():
 
     This is a session-scoped autouse fixture, so it runs once before any
     tests in this file and ensures that the environment is configured.
+    The load is skipped when conftest.py has already loaded the same file.
     """
+    if os.environ.get("_AEF_DOTENV_LOADED"):
+        return
+    from dotenv import load_dotenv
+
     dotenv_path = PROJECT_ROOT / ".env"
     if dotenv_path.exists():
         print(f"Loading environment variables from: {dotenv_path}")
@@ -42,6 +41,24 @@ def setup_env():
     else:
         print(f"Warning: .env file not found at {dotenv_path}")
 
+@pytest.fixture(scope="module", autouse=True)
+def _mock_externals():
+    """Patches the SDK initializers and product loading for this module.
+
+    The patches are removed when the module's tests finish, and the
+    runner's record of the (mocked) Vertex AI initialization is cleared, so
+    later modules initialize the real SDKs.
+    """
+    from unittest.mock import patch
+
+    with patch('vertexai.init'), patch('google.cloud.aiplatform.init'), patch(
+        'personalized_shopping.shared_libraries.web_agent_site.envs.web_agent_text_env.load_products',
+        return_value=([], {}, {}, defaultdict(set)),
+    ):
+        yield
+    from agent_eval_framework import runner
+    runner._VERTEX_AI_INIT_KEY = None
+
 def test_run_evaluation(mocker):
     """Tests the `run_evaluation` function with mocked external dependencies.
 
@@ -53,9 +70,10 @@ def test_run_evaluation(mocker):
     Args:
         mocker: The pytest-mock fixture for mocking objects.
     """
-    # Mock GCP calls
-    mocker.patch('vertexai.init')
-    mocker.patch('google.cloud.aiplatform.init')
+    import pandas as pd
+
+    # Mock the evaluation call; SDK init and data loading are patched by
+    # the module-scoped _mock_externals fixture.
     mock_eval_result = mocker.Mock()
     mock_eval_result.summary_metrics = {"some_metric": 1.0}
     mock_eval_result.metrics_table = pd.DataFrame() # Mock metrics_table as an empty DataFrame
@@ -64,11 +82,6 @@ def test_run_evaluation(mocker):
     mock_eval_task_instance = mock_eval_task_class.return_value
     mock_eval_task_instance.evaluate.return_value = mock_eval_result
 
-    # Mock data loading
-    mocker.patch(
-        'personalized_shopping.shared_libraries.web_agent_site.envs.web_agent_text_env.load_products',
-        return_value=([], {}, {}, defaultdict(set))
-    )
     from agent_eval_framework.runner import run_evaluation
     config_path = os.path.join(os.path.dirname(__file__), "..", "config", "eval_config.yaml")
     assert os.path.exists(config_path), f"Config file not found: {config_path}"
@@ -76,3 +89,73 @@ def test_run_evaluation(mocker):
     eval_result = run_evaluation(config_path)
     assert eval_result is not None
     print("Eval result summary:", eval_result.summary_metrics)
+
+def test_compose_column_map_renames_prompt_and_target():
+    """Prompt and target columns map to the names the service expects."""
+    from agent_eval_framework.runner import _compose_column_map
+
+    assert _compose_column_map({}, "query", "expected") == {"query": "prompt", "expected": "reference"}
+
+def test_compose_column_map_chains_user_mapping():
+    """A user mapping onto the prompt column is composed into one rename."""
+    from agent_eval_framework.runner import _compose_column_map
+
+    column_map = _compose_column_map({"q": "query", "ctx": "context"}, "query", "expected")
+    assert column_map == {"q": "prompt", "ctx": "context", "expected": "reference"}
+
+def test_metric_referenced_columns_reads_inline_template_and_columns():
+    """Inline template placeholders, `columns` and trajectory metrics are collected."""
+    from agent_eval_framework.runner import _metric_referenced_columns
+
+    columns = _metric_referenced_columns([
+        "trajectory_exact_match",
+        {"name": "tone", "type": "pointwise", "metric_prompt_template": "Rate {response} given {context}."},
+        {"name": "scorer", "type": "custom_function", "custom_function_path": "a.b", "columns": ["tags"]},
+    ])
+    assert columns == {"predicted_trajectory", "reference_trajectory", "response", "context", "tags"}
+
+def test_metric_referenced_columns_resolves_example_template():
+    """A pointwise metric without a template reads its example template's placeholders."""
+    from agent_eval_framework.runner import _metric_referenced_columns
+
+    columns = _metric_referenced_columns([{"name": "multi_turn_chat_quality", "type": "pointwise"}])
+    assert {"history", "response"} <= columns
+
+def test_metric_referenced_columns_keeps_everything_when_unknown():
+    """Columns that cannot be determined disable the projection."""
+    from agent_eval_framework.runner import _metric_referenced_columns
+
+    assert _metric_referenced_columns([{"name": "no_such_example", "type": "pointwise"}]) is None
+    assert _metric_referenced_columns([{"name": "scorer", "type": "custom_function", "custom_function_path": "a.b"}]) is None
+    assert _metric_referenced_columns([{"name": "odd", "type": "pointwise", "metric_prompt_template": "{unclosed"}]) is None
+
+class _RateLimitedAdapter:
+    """Fails each prompt with a google-genai 429 twice, then answers it."""
+
+    def __init__(self):
+        self.calls = defaultdict(int)
+
+    def get_response(self, prompt):
+        from google.genai import errors
+
+        self.calls[prompt] += 1
+        if self.calls[prompt] <= 2:
+            raise errors.ClientError(429, {"error": {"code": 429, "message": "Resource exhausted", "status": "RESOURCE_EXHAUSTED"}})
+        return {"actual_response": f"answer to {prompt}"}
+
+class _AsyncRateLimitedAdapter(_RateLimitedAdapter):
+    async def aget_response(self, prompt):
+        return self.get_response(prompt)
+
+@pytest.mark.parametrize("adapter_class", [_RateLimitedAdapter, _AsyncRateLimitedAdapter])
+def test_generate_all_responses_retries_rate_limited_prompts(mocker, adapter_class):
+    """A prompt rate limited twice succeeds on its third attempt."""
+    from agent_eval_framework import runner
+
+    mocker.patch.object(runner, "_rate_limit_delay", return_value=0)
+    adapter = adapter_class()
+
+    outputs = runner._generate_all_responses(adapter, ["a", "b"], {})
+
+    assert outputs == [{"actual_response": "answer to a"}, {"actual_response": "answer to b"}]
+    assert adapter.calls == {"a": 3, "b": 3}
@@ -14,105 +14,138 @@
 
 """Integration tests for the agent evaluation runner with Vertex AI.
 
-These tests run the full evaluation pipeline, including making live calls to
-the Vertex AI API and a deployed agent. They are designed to be run in an
-environment where Google Cloud credentials are properly configured.
+These tests run the full evaluation pipeline. By default the Vertex AI SDK,
+the evaluation service and the agent are replaced with mocks, so the tests
+exercise the runner's orchestration without network calls. Set
+`RUN_LIVE_EVAL=1` to make live calls to the Vertex AI API and a deployed
+agent instead; that mode needs Google Cloud credentials to be properly
+configured.
 """
 
+import copy
 import pytest
 import os
 from google.cloud import aiplatform
 from google.api_core import exceptions
 from agent_eval_framework.runner import run_evaluation
-import uuid
-from datetime import datetime
-import yaml
+from types import SimpleNamespace
 
-def load_config(config_path):
-    """Loads a YAML configuration file.
+CONFIG_PATH = "agent-eval-framework/config/adk_eval_config.yaml"
+
+RUN_LIVE_EVAL = os.getenv("RUN_LIVE_EVAL") == "1"
+
+# Skip live runs at collection time, before the session fixtures initialize
+# Vertex AI. conftest.py has already loaded the project .env by this point.
+pytestmark = pytest.mark.skipif(
+    RUN_LIVE_EVAL and (not os.getenv("GOOGLE_CLOUD_PROJECT") or not os.getenv("GOOGLE_CLOUD_LOCATION")),
+    reason="GOOGLE_CLOUD_PROJECT and GOOGLE_CLOUD_LOCATION must be set in .env file to run Vertex AI evaluations.",
+)
+
+@pytest.fixture(scope="function")
+def eval_config(_cached_eval_config):
+    """Provides a private copy of the evaluation configuration.
+
+    The YAML is parsed once per session; each test gets a deep copy so it
+    can modify the configuration without affecting other tests.
 
     Args:
-        config_path: The path to the YAML file.
+        _cached_eval_config: The session-wide configuration, parsed in
+            conftest.py.
 
     Returns:
-        A dictionary containing the loaded configuration.
+        A dictionary with the evaluation configuration.
     """
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
-
-CONFIG_PATH = "agent-eval-framework/config/adk_eval_config.yaml"
+    return copy.deepcopy(_cached_eval_config)
 
 @pytest.fixture(scope="session")
-def eval_config():
-    """Provides the evaluation configuration loaded from the YAML file.
+def _vertex_init(_cached_eval_config):
+    """Initializes Vertex AI once for the whole test session, for live runs.
 
-    This is a session-scoped fixture, so the configuration is loaded only
-    once per test session.
+    `aiplatform.init` only sets global SDK configuration, so there is no
+    need to repeat it for every test.
+
+    Args:
+        _cached_eval_config: The session-wide configuration.
 
     Returns:
-        A dictionary with the evaluation configuration.
+        The session-wide configuration.
     """
-    return load_config(CONFIG_PATH)
+    if RUN_LIVE_EVAL:
+        project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
+        location = os.getenv("GOOGLE_CLOUD_LOCATION")
+        aiplatform.init(project=project_id, location=location)
+    return _cached_eval_config
+
+class _StubAgentAdapter:
+    """An agent adapter that answers every prompt with an empty response."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def get_response(self, prompt):
+        return {"actual_response": "", "predicted_trajectory": '{"tool_calls": []}'}
 
 @pytest.fixture(scope="function")
-def unique_run_suffix():
-    """Generates a unique suffix for a test run name.
+def mock_eval_task(mocker, monkeypatch):
+    """Replaces the agent and the Vertex AI calls made by `run_evaluation`.
+
+    Does nothing when `RUN_LIVE_EVAL=1`, so the test runs against the live
+    services.
 
-    This ensures that each test execution creates a new, non-conflicting run
-    in Vertex AI Experiments.
+    Args:
+        mocker: The pytest-mock fixture for mocking objects.
+        monkeypatch: The pytest fixture for setting environment variables.
 
     Returns:
-        A unique string combining a timestamp and a UUID.
+        The mocked `EvalTask` class, or None for live runs.
     """
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    unique_id = str(uuid.uuid4())[:8]
-    return f"{timestamp}-{unique_id}"
+    if RUN_LIVE_EVAL:
+        return None
+    monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
+    monkeypatch.setenv("GOOGLE_CLOUD_LOCATION", "us-central1")
+    mocker.patch("agent_eval_framework.runner._load_env")
+    mocker.patch("agent_eval_framework.runner._init_vertex_ai")
+    mocker.patch("agent_eval_framework.runner.load_class", return_value=_StubAgentAdapter)
+    eval_task_class = mocker.patch("agent_eval_framework.runner.EvalTask")
+    eval_task_class.return_value.evaluate.return_value = SimpleNamespace(
+        summary_metrics={"exact_match": 1.0}, metrics_table=None
+    )
+    return eval_task_class
 
 @pytest.fixture(scope="function")
-def vertex_ai_context_manager(eval_config, unique_run_suffix):
-    """Initializes Vertex AI and yields a unique run name for a test.
+def vertex_ai_context_manager(_vertex_init, unique_run_suffix):
+    """Yields a unique run name for a test, with Vertex AI initialized.
 
-    This fixture handles the setup of the Vertex AI environment and is
-    intended to also handle the teardown (cleanup) of the created experiment
-    run, although the cleanup is currently disabled.
+    This fixture is intended to also handle the teardown (cleanup) of the
+    created experiment run, although the cleanup is currently disabled.
 
     Args:
-        eval_config: The evaluation configuration dictionary.
+        _vertex_init: The fixture that initializes Vertex AI for the session.
         unique_run_suffix: The unique suffix for the run name.
 
     Yields:
         The full, unique experiment run name for the test.
     """
-    project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
-    location = os.getenv("GOOGLE_CLOUD_LOCATION")
-
-    experiment_name = eval_config.get("experiment_name", "default-experiment")
-    run_name_prefix = eval_config.get("run_name_prefix", "run")
-
+    run_name_prefix = _vertex_init.get("run_name_prefix", "run")
     experiment_run_name = f"{run_name_prefix}-{unique_run_suffix}"
-    actual_context_id = f"{experiment_name}-{experiment_run_name}"
-
-    aiplatform.init(project=project_id, location=location)
 
     yield experiment_run_name
 
     print("Teardown disabled. Run will be preserved in Vertex AI.")
 
-def test_shopping_agent_vertex_eval(vertex_ai_context_manager, eval_config):
-    """Runs an end-to-end evaluation using the live Vertex AI service.
+def test_shopping_agent_vertex_eval(vertex_ai_context_manager, eval_config, mock_eval_task):
+    """Runs an end-to-end evaluation, against the live Vertex AI service if enabled.
 
     This test executes the `run_evaluation` function with a specific configuration
-    that points to a live, deployed agent. It verifies that the evaluation
-    completes successfully and produces a result. This test is skipped if
-    GCP environment variables are not set.
+    that points to a deployed agent. It verifies that the evaluation
+    completes successfully and produces a result. Live runs
+    (`RUN_LIVE_EVAL=1`) are skipped if GCP environment variables are not set.
 
     Args:
         vertex_ai_context_manager: The fixture that provides the unique run name.
         eval_config: The fixture that provides the evaluation configuration.
+        mock_eval_task: The mocked `EvalTask` class, or None for live runs.
     """
-    if not os.getenv("GOOGLE_CLOUD_PROJECT") or not os.getenv("GOOGLE_CLOUD_LOCATION"):
-        pytest.skip("GOOGLE_CLOUD_PROJECT and GOOGLE_CLOUD_LOCATION must be set in .env file to run Vertex AI evaluations.")
-
     experiment_run_name = vertex_ai_context_manager
 
     print(f"Running evaluation with config: {CONFIG_PATH}")
@@ -120,10 +153,10 @@ def test_shopping_agent_vertex_eval(vertex_ai_context_manager, eval_config):
     actual_context_id = f"{eval_config.get('experiment_name')}-{experiment_run_name}"
     print(f"Expecting actual context ID to be: {actual_context_id}")
 
-    try:
-        eval_result = run_evaluation(config_path=CONFIG_PATH, experiment_run_name=experiment_run_name)
+    # Errors from run_evaluation propagate so pytest shows their traceback.
+    eval_result = run_evaluation(config_path=CONFIG_PATH, experiment_run_name=experiment_run_name)
 
-        assert eval_result is not None, "Evaluation failed to produce results."
-        print("Evaluation completed successfully using agent-eval-framework.")
-    except Exception as e:
-        pytest.fail(f"run_evaluation failed: {e}")
+    assert eval_result is not None, "Evaluation failed to produce results."
+    if mock_eval_task is not None:
+        mock_eval_task.return_value.evaluate.assert_called_once_with(experiment_run_name=experiment_run_name)
+    print("Evaluation completed successfully using agent-eval-framework.")
@@ -32,7 +32,6 @@ The script performs the following steps:
     working correctly.
 """
 
-import glob
 import os
 
 import vertexai
@@ -46,7 +45,11 @@ from personalized_shopping.agent import root_agent
 
 # --- Initialization ---
 
-load_dotenv()
+# Skip the .env parse when a parent process has already applied it. Shell
+# variables keep precedence here, so the marker (which means the project .env
+# was applied with override=True) is left unset.
+if not os.getenv("_AEF_DOTENV_LOADED"):
+    load_dotenv()
 
 cloud_project = os.getenv("GOOGLE_CLOUD_PROJECT")
 cloud_location = os.getenv("GOOGLE_CLOUD_LOCATION")
@@ -85,15 +88,22 @@ try:
     script_dir = os.path.dirname(os.path.abspath(__file__))
     dist_dir = os.path.join(script_dir, "..", "dist")
     
-    whl_files = glob.glob(os.path.join(dist_dir, "*.whl"))
-    if not whl_files:
+    # Use the newest wheel; scandir's entries reuse the stat data from the
+    # directory listing instead of a separate stat call per file.
+    with os.scandir(dist_dir) as entries:
+        latest_whl = max(
+            (entry for entry in entries if entry.name.endswith(".whl") and entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime,
+            default=None,
+        )
+    if latest_whl is None:
         raise FileNotFoundError(
             "Could not find the .whl package in the '../dist/' directory. "
             "Please run 'poetry build' in the project root first."
         )
     
     # Make the path relative to the current directory (deployment/)
-    AGENT_WHL_FILE = os.path.relpath(whl_files[0], start=script_dir)
+    AGENT_WHL_FILE = os.path.relpath(latest_whl.path, start=script_dir)
     print(f"Found agent package at: {AGENT_WHL_FILE}")
 
 except Exception as e:
@@ -123,9 +133,10 @@ print("-" * 50)
 
 print("Testing deployment with a simple query...")
 try:
-    response = remote_app.query(input="Hello!")
+    events = list(remote_app.stream_query(message="Hello!", user_id="deployment_test_user"))
     print("\nTest query successful! Response:")
-    print(response)
+    for event in events:
+        print(event)
 except Exception as e:
     print(f"\nTest query failed: {e}")
 
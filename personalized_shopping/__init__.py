@@ -18,6 +18,13 @@ import torch
 torch.classes.__path__ = []
 
 from .shared_libraries.init_env import init_env, get_webshop_env
-from .agent import root_agent
 
 __all__ = ["root_agent"]
+
+
+def __getattr__(name):
+    """Imports `root_agent` on first access, so importing the package does not build it."""
+    if name == "root_agent":
+        from .agent import root_agent
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,37 +14,55 @@
 
 """Defines and configures the Personalized Shopping Agent.
 
-This module initializes the primary agent for the application. It configures
+This module provides the primary agent for the application. It configures
 the agent with a specific model, instructions, and a set of tools necessary
 for interacting with the shopping environment.
+
+The agent is built on first access to `root_agent`, so importing this module
+(for example during test collection) does not pay for loading ADK and
+generating the tool schemas.
 """
 
-from google.adk.agents import Agent
-from google.adk.tools import FunctionTool
+import functools
 
-# Absolute imports from the personalized_shopping package
-from personalized_shopping.tools.search import search
-from personalized_shopping.tools.click import click
-from personalized_shopping.prompt import personalized_shopping_agent_instruction
 
-root_agent = Agent(
+@functools.lru_cache(maxsize=None)
+def get_root_agent():
+    """Builds the primary agent for the personalized shopping experience.
 
-    model="gemini-2.5-flash", # Or your preferred model
+    The agent is built once; later calls return the same instance. It is
+    configured with:
+    - A powerful and efficient model (`gemini-2.5-flash`).
+    - A specific set of instructions defined in `prompt.py`.
+    - The `search` and `click` tools, which allow it to navigate and query the
+      shopping environment.
 
-    name="personalized_shopping_agent",
-    instruction=personalized_shopping_agent_instruction,
-    tools=[
-        FunctionTool(func=search),
-        FunctionTool(func=click),
-    ],
-)
-"""The primary agent for the personalized shopping experience.
+    Returns:
+        The `google.adk.agents.Agent` instance.
+    """
+    from google.adk.agents import Agent
+    from google.adk.tools import FunctionTool
+
+    # Absolute imports from the personalized_shopping package
+    from personalized_shopping.tools.search import search
+    from personalized_shopping.tools.click import click
+    from personalized_shopping.prompt import personalized_shopping_agent_instruction
+
+    return Agent(
+
+        model="gemini-2.5-flash", # Or your preferred model
+
+        name="personalized_shopping_agent",
+        instruction=personalized_shopping_agent_instruction,
+        tools=[
+            FunctionTool(func=search),
+            FunctionTool(func=click),
+        ],
+    )
 
-This `Agent` instance is configured with:
-- A powerful and efficient model (`gemini-1.5-flash-001`).
-- A specific set of instructions defined in `prompt.py`.
-- The `search` and `click` tools, which allow it to navigate and query the
-  shopping environment.
-"""
 
-print("personalized_shopping.agent module loaded and root_agent defined.")
+def __getattr__(name):
+    """Builds `root_agent` on first access (PEP 562)."""
+    if name == "root_agent":
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -23,7 +23,7 @@ is not hosted on a remote server.
 """
 
 from agent_eval_framework.adapters import BaseAgentAdapter
-from personalized_shopping.agent import root_agent as local_shopping_agent
+from personalized_shopping.agent import get_root_agent
 
 class LocalAgentAdapter(BaseAgentAdapter):
     """An adapter to interface with a local, in-process agent instance.
@@ -41,7 +41,7 @@ class LocalAgentAdapter(BaseAgentAdapter):
         This adapter requires no configuration as it directly instantiates
         the agent from the imported source code.
         """
-        self.agent = local_shopping_agent
+        self.agent = get_root_agent()
 
     def get_response(self, prompt: str) -> dict:
         """Calls the local agent and returns its response and trajectory.
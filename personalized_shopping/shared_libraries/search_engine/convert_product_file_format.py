@@ -21,10 +21,10 @@ document to be indexed. The 'contents' of each document are a concatenation
 of key product fields (Title, Description, etc.) to enable full-text search.
 """
 
-import json
 import sys
 import os
 import pathlib
+import orjson
 from tqdm import tqdm
 
 # --- Add project root to sys.path ---
@@ -39,6 +39,9 @@ from personalized_shopping.shared_libraries.web_agent_site.engine.engine import
 INPUT_FILEPATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "web_agent_site", "data", "items_shuffle_1000.json"))
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "resources_1k")
 
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_CHUNK_SIZE = 1024
+
 print(f"Loading products from: {INPUT_FILEPATH}")
 if not os.path.exists(INPUT_FILEPATH):
     raise FileNotFoundError(f"Input data file not found: {INPUT_FILEPATH}")
@@ -70,8 +73,11 @@ for p in tqdm(all_products, total=len(all_products)):
 
 print(f"Writing {len(docs)} documents to {OUTPUT_DIR}")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
-with open(os.path.join(OUTPUT_DIR, "documents.jsonl"), "w+") as f:
-    for doc in docs:
-        f.write(json.dumps(doc) + "\n")
+# Write the documents in chunks through a large buffer, so the output is
+# built with one join and one write call per chunk instead of per document.
+with open(os.path.join(OUTPUT_DIR, "documents.jsonl"), "wb", buffering=WRITE_BUFFER_SIZE) as f:
+    for start in range(0, len(docs), WRITE_CHUNK_SIZE):
+        chunk = docs[start:start + WRITE_CHUNK_SIZE]
+        f.write(b"".join(orjson.dumps(doc) + b"\n" for doc in chunk))
 
 print("Conversion complete.")
@@ -5,13 +5,12 @@
 
 from ast import literal_eval
 from collections import defaultdict
-from decimal import Decimal
-import json
 import os
 import random
 import re
 from os.path import join, dirname, abspath
 
+import orjson
 from flask import render_template_string
 from pyserini.search.lucene import LuceneSearcher
 from rich import print
@@ -23,6 +22,9 @@ from personalized_shopping.shared_libraries.web_agent_site.engine.utils import (
     HUMAN_ATTR_PATH,
 )
 
+# Strips currency symbols, commas and spaces from a price string.
+_PRICE_RE = re.compile(r"[^\d.]")
+
 BASE_DIR = dirname(abspath(__file__))
 TEMPLATE_DIR = os.path.join(BASE_DIR, "..", "templates")
 
@@ -123,7 +125,7 @@ def get_top_n_product_from_keywords(
         keywords = " ".join(keywords)
         hits = search_engine.search(keywords, k=SEARCH_RETURN_N)
         docs = [search_engine.doc(hit.docid) for hit in hits]
-        top_n_asins = [json.loads(doc.raw())["id"] for doc in docs]
+        top_n_asins = [orjson.loads(doc.raw())["id"] for doc in docs]
         top_n_products = [
             product_item_dict[asin] for asin in top_n_asins if asin in product_item_dict
         ]
@@ -195,13 +197,18 @@ def clean_product_keys(products):
     return products
 
 
+def _load_json_file(path):
+    """Reads and parses a JSON file."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def load_products(filepath, num_products=None, human_goals=True):
     print(f"Attempting to load products from: {filepath}")
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Product file not found: {filepath}. Please check download and paths.")
 
-    with open(filepath) as f:
-        products = json.load(f)
+    products = _load_json_file(filepath)
     print("Products loaded.")
     products = clean_product_keys(products)
 
@@ -213,12 +220,10 @@ def load_products(filepath, num_products=None, human_goals=True):
         if not os.path.exists(HUMAN_ATTR_PATH):
              print(f"Warning: Human attributes file not found: {HUMAN_ATTR_PATH}")
         else:
-            with open(HUMAN_ATTR_PATH) as f:
-                human_attributes = json.load(f)
+            human_attributes = _load_json_file(HUMAN_ATTR_PATH)
     if not os.path.exists(DEFAULT_ATTR_PATH):
         raise FileNotFoundError(f"Default attributes file not found: {DEFAULT_ATTR_PATH}")
-    with open(DEFAULT_ATTR_PATH) as f:
-        attributes = json.load(f)
+    attributes = _load_json_file(DEFAULT_ATTR_PATH)
     print("Attributes loaded.")
 
     asins = set()
@@ -263,10 +268,8 @@ def load_products(filepath, num_products=None, human_goals=True):
             price_tag = "$100.00"
         else:
             try:
-                parsed_pricing = [
-                    float(Decimal(re.sub(r"[^\d.]", "", price)))
-                    for price in str(pricing).split("$") if re.sub(r"[^\d.]", "", price)
-                ]
+                cleaned_prices = (_PRICE_RE.sub("", price) for price in str(pricing).split("$"))
+                parsed_pricing = [float(price) for price in cleaned_prices if price]
                 if not parsed_pricing: parsed_pricing = [100.0]
                 pricing = parsed_pricing
             except Exception:
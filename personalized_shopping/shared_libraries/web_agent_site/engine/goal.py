@@ -3,6 +3,7 @@
 """Functions for specifying goals and reward calculations."""
 
 from collections import defaultdict
+import functools
 import itertools
 import random
 from rich import print
@@ -11,12 +12,20 @@ from thefuzz import fuzz
 # Absolute import
 from personalized_shopping.shared_libraries.web_agent_site.engine.normalize import normalize_color
 
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading 'en_core_web_sm' for spaCy...")
-    spacy.cli.download("en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+# Only part-of-speech tags are used (see get_type_reward), so the parser,
+# NER and lemmatizer are not loaded.
+_SPACY_DISABLED_PIPES = ["parser", "ner", "lemmatizer"]
+
+
+@functools.lru_cache(maxsize=None)
+def get_nlp():
+    """Loads the spaCy pipeline on first use, downloading it if missing."""
+    try:
+        return spacy.load("en_core_web_sm", disable=_SPACY_DISABLED_PIPES)
+    except OSError:
+        print("Downloading 'en_core_web_sm' for spaCy...")
+        spacy.cli.download("en_core_web_sm")
+        return spacy.load("en_core_web_sm", disable=_SPACY_DISABLED_PIPES)
 
 PRICE_RANGE = [10.0 * i for i in range(1, 100)]
 
@@ -153,6 +162,7 @@ def get_type_reward(purchased_product, goal):
     purchased_type = purchased_product["name"]
     desired_type = goal["name"]
 
+    nlp = get_nlp()
     purchased_type_parse = nlp(purchased_type)
     desired_type_parse = nlp(desired_type)
 
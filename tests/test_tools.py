@@ -28,7 +28,12 @@ def load_env():
 
     This is a session-scoped autouse fixture, so it runs once before any
     tests in this file and ensures that the environment is configured.
+    The load is skipped when the environment was already loaded from .env.
     """
+    if os.environ.get("_AEF_DOTENV_LOADED"):
+        return
+    # Shell variables keep precedence here, so the sentinel (which means the
+    # project .env was applied with override=True) is left unset.
     dotenv.load_dotenv()
 
 